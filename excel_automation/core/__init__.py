@@ -2,3 +2,4 @@
 from .excel_auto_chart import ExcelAutoChart
 from .excel_formatter import ExcelFormatter
 from .excel_data_extractor import ExcelDataExtractor
+from .workbook_loader import WorkbookLoad, load_workbooks
@@ -1,34 +1,57 @@
+import numpy as np
 import pandas as pd
 from xlsxwriter.workbook import Workbook
 from xlsxwriter.worksheet import Worksheet
 from .excel_writer import ExcelWriterXL
-from ..utils import Color, Formats
+from ..utils import Color, Formats, text_metrics, thaw
+from ..utils.numeric_masks import THOUSANDS_THRESHOLD
 from typing import Literal, Tuple
 from itertools import cycle
-import copy
 
 # TODO: Raise errors for invalid templates
 # TODO: Use worksheet.dim_colmax
 class ExcelAutoChart:
-    def __init__(self, df_list: list[pd.DataFrame], output_name: str, output_folder: str):
+    def __init__(
+        self, 
+        df_list: list[pd.DataFrame], 
+        output_name: str, 
+        output_folder: str, 
+        constant_memory: bool = False, 
+        conditional_formatting: bool = False
+    ):
         """Class to write to Excel files from DataFrames and creating charts. Engine: xlsxwriter
 
         Parameters
         ----------
         df_list : list(pd.DataFrame):
-            Data that will be written to Excel
+            Data that will be written to Excel. Items can also be iterables of DataFrame chunks
+            (or callables returning one): tables stream them to the sheet, charts load them in full.
         output_name : str: 
             Name for the output file (extension already provided)
         output_folder : str:
             Folder path to save the file in.
+        constant_memory : bool, optional
+            Streams each sheet to disk row by row to keep memory flat (see ExcelWriterXL).
+        conditional_formatting : bool, optional
+            Style table banding and highlighted rows with conditional formats (see ExcelFormatter).
         """
         self.df_list = df_list
-        self.writer = ExcelWriterXL(df_list, output_name, output_folder)
+        self.writer = ExcelWriterXL(df_list, output_name, output_folder, constant_memory, conditional_formatting)
         self.workbook: Workbook = self.writer.workbook
+        self.format_registry = self.writer.format_registry
         self.format = Formats()
         self.tab_counter = 0
         self.fig_counter = 0
         
+    def _get_dataframe(self, index: int) -> pd.DataFrame:
+        """Returns df_list[index], concatenating (and caching) chunked input since charts need the full data."""
+        df = self.df_list[index]
+        if not isinstance(df, pd.DataFrame):
+            chunks = df() if callable(df) else df
+            df = pd.concat(list(chunks), ignore_index=True)
+            self.df_list[index] = df
+        return df
+
     # TODO: Consider discussing chart font being Aptos Narrow
     # TODO: chart.set_y_axis({'crossing': 'min'}) if values < 0
     def _create_base_chart(self, chart_type: str, chart_subtype: str = ""):
@@ -44,9 +67,9 @@ class ExcelAutoChart:
 
     def _configure_dynamic_values(self, df: pd.DataFrame, bar: bool = False)-> Tuple[dict, dict, int]:
         "Returns legend, plot_area, sp_axis_num_format, num_font"
-        plot_area = copy.deepcopy(self.format.charts["basic"]["plotarea"])
-        legend = copy.deepcopy(self.format.charts["basic"]["legend"])
-        first_col_max_len = max([len(str(value)) for value in df.iloc[:,0]])
+        plot_area = thaw(self.format.charts["basic"]["plotarea"])  # Mutable copy, adjusted below and by the callers
+        legend = self.format.charts["basic"]["legend"]
+        first_col_max_len = text_metrics(df).max_length(0)
         high_len = first_col_max_len > 5
         columns = df.shape[1] - 1
 
@@ -154,7 +177,7 @@ class ExcelAutoChart:
         self.fig_counter += 1
         sheet_name = sheet_name if sheet_name else f"Fig{self.fig_counter}"
         df, worksheet = self.writer.write_from_df(
-            df = self.df_list[index], 
+            df = self._get_dataframe(index), 
             sheet_name = sheet_name, 
             num_format = num_format, 
             format_template= "database")
@@ -293,7 +316,7 @@ class ExcelAutoChart:
         self.fig_counter += 1
         sheet_name = sheet_name if sheet_name else f"Fig{self.fig_counter}"
         df, worksheet = self.writer.write_from_df(
-            df = self.df_list[index], 
+            df = self._get_dataframe(index), 
             sheet_name = sheet_name, 
             num_format = num_format, 
             format_template= "database")
@@ -388,7 +411,7 @@ class ExcelAutoChart:
         sheet_name: str = "",
         grouping: Literal['standard', 'stacked', 'percentStacked'] = "standard",
         numeric_type: Literal['decimal_1', 'decimal_2', 'integer', 'percentage'] = "decimal_1",
-        highlighted_category: str = "",
+        highlighted_category: str | list[str] = "",
         template: Literal['bar', 'bar_single', 'bar_double'] = "bar",
         axis_title: str = "",
         custom_colors: list[str] | None = None,
@@ -406,8 +429,8 @@ class ExcelAutoChart:
         numeric_type : str, optional
             Defines the number format for the series. Options are:
             'integer', 'decimal_1', 'decimal_2', 'percentage'. (default is 'decimal_2')
-        highlighted_category : str, optional
-            Category that will be highlighted with a different color (red).
+        highlighted_category : str or list[str], optional
+            Category (or categories) that will be highlighted with a different color (red).
         template : str, optional
             Template for the chart configuration: 'bar', 'bar_single' or 'bar_double' (default is "bar").
         axis_title : str, optional
@@ -434,7 +457,7 @@ class ExcelAutoChart:
         self.fig_counter += 1
         sheet_name = sheet_name if sheet_name else f"Fig{self.fig_counter}"
         df, worksheet = self.writer.write_from_df(
-            df = self.df_list[index], 
+            df = self._get_dataframe(index), 
             sheet_name = sheet_name, 
             num_format = num_format, 
             format_template= "database")
@@ -474,37 +497,25 @@ class ExcelAutoChart:
             chart.set_size(configs["size"])
 
         # Add data series with color scheme
+        if pd.api.types.is_list_like(highlighted_category):
+            highlighted = df.iloc[:, 0].isin(highlighted_category).to_numpy()
+        elif highlighted_category:
+            highlighted = (df.iloc[:, 0] == highlighted_category).to_numpy()
+        else:
+            highlighted = np.zeros(len(df), dtype=bool)
         for idx, col in enumerate(df.columns[1:]):
             col_idx = idx + 1
             current_color = next(color_cycle)
 
-            points = []
-            for row_idx in range(df.shape[0]):
-                cell_value = df.iloc[row_idx, col_idx]
-                point_format = {}
-                
-                # Configuración del color (tu lógica original)
-                if highlighted_category is not None:
-                    category_value = df.iloc[row_idx, 0]
-                    if category_value == highlighted_category:
-                        color = Color.RED_DARK if col_idx == 1 else Color.RED_LIGHT
-                    else:
-                        color = current_color
-
-                    point_format['fill'] = {
-                        'color': color
-                    }
-                
-                # Configuración especial para valores > 9999
-                try:
-                    if float(cell_value) > 9999:
-                        point_format['data_labels'] = {
-                            'num_format': '# ##0'
-                        }
-                except (ValueError, TypeError):
-                    pass
-                
-                points.append(point_format)
+            # Point colors (highlighted category) and data labels for values > 9999. Other points keep the series 
+            # defaults (None), so only the points that differ are written to the chart
+            with np.errstate(invalid='ignore'):
+                needs_mask = (pd.to_numeric(df.iloc[:, col_idx], errors='coerce').to_numpy(dtype=float, na_value=np.nan) > THOUSANDS_THRESHOLD).tolist()
+            highlighted_color = {'fill': {'color': Color.RED_DARK if col_idx == 1 else Color.RED_LIGHT}}
+            points = [
+                {**(highlighted_color if is_highlighted else {}), **({'data_labels': {'num_format': '# ##0'}} if mask else {})} or None
+                for is_highlighted, mask in zip(highlighted.tolist(), needs_mask)
+            ]
             
             data_labels = {**configs['series']['data_labels'], 'num_format': num_format}
             data_labels.update({'font': {'color': Color.WHITE if col_idx == 1 else Color.BLACK}})
@@ -515,9 +526,10 @@ class ExcelAutoChart:
                 'values': [sheet_name, 1, col_idx, len(df), col_idx],
                 'categories': [sheet_name, 1, 0, len(df), 0],
                 'fill': {'color': current_color},
-                'data_labels': {data_labels},
-                'points': points
+                'data_labels': data_labels,
             }
+            if any(points):
+                series_params['points'] = points
             chart.add_series(series_params)
 
         # Configure axes
@@ -602,7 +614,7 @@ class ExcelAutoChart:
         self.fig_counter += 1
         sheet_name = sheet_name if sheet_name else f"Fig{self.fig_counter}"
         df, worksheet = self.writer.write_from_df(
-            df = self.df_list[index], 
+            df = self._get_dataframe(index), 
             sheet_name = sheet_name, 
             num_format = num_format, 
             format_template= "database")
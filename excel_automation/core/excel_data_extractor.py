@@ -1,9 +1,37 @@
 import os
+import datetime
+import numpy as np
+from functools import partial
+from itertools import islice
 import pandas as pd
-from typing import Literal
+from typing import Any, Callable, Iterator, Literal
+from .excel_readers import ReaderBackend, header_names, key_text, open_reader, raw_value, rows_to_dataframe
+from ..utils.lazy_sheets import LazySheets
+from ..utils.row_index import RowIndex
+from ..utils.sheet_cache import SheetCache, shared_sheet_cache
+
+# Object columns whose non-blank cells infer to these types are converted to numeric dtypes
+NUMERIC_INFERRED_TYPES = ("integer", "floating", "mixed-integer-float", "decimal")
+# Object columns that xlsxwriter writes exactly like pandas' to_excel without a number format (no dates or times)
+PLAIN_INFERRED_TYPES = ("empty", "string", "boolean", "integer", "floating", "mixed-integer", "mixed-integer-float", "decimal", "mixed")
+DATE_TYPES = (datetime.date, datetime.time, datetime.timedelta, np.datetime64, np.timedelta64)
+INFINITY_TEXT = {np.inf: "inf", -np.inf: "-inf"}  # pandas' default inf_rep
+# Partial aggregates kept per streamed chunk for each aggregation, and how partials of the same group are merged
+PARTIAL_AGGREGATIONS = {"sum": ("sum",), "mean": ("sum", "count"), "count": ("count",), "min": ("min",), "max": ("max",)}
+MERGE_AGGREGATIONS = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
 
 class ExcelDataExtractor():
-    def __init__(self, file_name: str, folder_path: str):
+    def __init__(
+        self, 
+        file_name: str, 
+        folder_path: str, 
+        cache_dir: str | None = None, 
+        cache_max_bytes: int = 512 * 1024**2,
+        memory_cache: bool = False,
+        reader: Literal["openpyxl", "calamine", "iterparse"] = "openpyxl",
+        legacy_preprocessing: bool = False
+    ):
         """Class to obtain data from an Excel file, convert to DataFrame, apply transformations, and export it. 
         Engine: mostly pandas
 
@@ -13,21 +41,140 @@ class ExcelDataExtractor():
             The name of the Excel file to be loaded (.xlsx extension is provided)
         folder_path : str, optional:
             Folder path where file is located
+        cache_dir : str, optional
+            Opt-in folder where parsed and cleaned sheets are cached. Entries are invalidated when the workbook
+            changes (size, mtime or content), so re-runs over unchanged files skip parsing entirely.
+        cache_max_bytes : int, optional
+            Size budget of `cache_dir`; least recently used entries are evicted beyond it. Defaults to 512 MB.
+        memory_cache : bool, optional
+            Opt-in process-wide LRU cache of parsed sheets (`utils.sheet_cache.shared_sheet_cache`), shared by all 
+            extractors, so re-creating an extractor for the same file does not parse it again. Reads return copies.
+        reader : {'openpyxl', 'calamine', 'iterparse'}, optional
+            Reader backend (see `excel_readers`). All of them produce the same DataFrames: 'openpyxl' is pandas' default,
+            'iterparse' streams the sheet XML directly (about twice as fast, no extra dependencies) and 'calamine' 
+            requires the optional python-calamine package.
+        legacy_preprocessing : bool, optional
+            By default, cleaned sheets keep numeric columns numeric (float64/int64, blanks as NaN, left for the writer 
+            to render empty) and only text columns use "" for blanks. If True, every blank becomes "" as in 
+            earlier versions, which turns numeric columns with gaps into object columns.
+
+        Notes
+        -----
+        The workbook is opened once, on first read, and the handle is reused for sheet names and every 
+        later read. Call `close()` or use the extractor as a context manager to release it.
         """
         self.file_path = os.path.join(folder_path, f'{file_name}.xlsx')
+        self.reader = reader
+        self._workbook: ReaderBackend | None = None
+        self._sheet_names: list[str] | None = None
+        self.sheet_cache = SheetCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.memory_cache = memory_cache
+        self.legacy_preprocessing = legacy_preprocessing
+
+    @property
+    def workbook(self) -> ReaderBackend:
+        """Workbook handle of the reader backend, opened lazily and kept until `close()`."""
+        if self._workbook is None:
+            self._workbook = open_reader(self.file_path, self.reader)
+        return self._workbook
+
+    @property
+    def sheet_names(self) -> list[str]:
+        # Cached too (under an empty sheet name), so a fully cached workbook is never opened, then kept on the instance
+        if self._sheet_names is None:
+            self._sheet_names = self._cached("", lambda: self.workbook.sheet_names)
+        return self._sheet_names
+
+    def close(self) -> None:
+        """Releases the workbook handle. The extractor can still be used, the file is reopened on demand."""
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+
+    def __enter__(self) -> "ExcelDataExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
         
     def _preprocess_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        # Remove rows/columns that are completely empty, then replace NaN with ""
-        df = df.dropna(axis=0, thresh=1).dropna(axis=1, thresh=1).fillna("")
-        
-        # Remove extra spaces from string columns
-        object_columns = df.select_dtypes(include=['object']).columns
+        # Remove rows/columns that are completely empty
+        df = df.dropna(axis=0, how="all").dropna(axis=1, how="all")
+        return self._clean_columns(df)
+
+    def _clean_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Strips text and settles blanks and numeric dtypes column by column (shared by whole sheets and streamed chunks)."""
+        object_columns = [col for col, dtype in df.dtypes.items() if dtype == object]
+        if self.legacy_preprocessing:
+            df = df.fillna("")  # Every blank becomes "" (numeric columns with gaps turn into object)
+
+        # Remove extra spaces from text columns in a single pass per column; other columns are not touched
+        cleaned = {}
         for col in object_columns:
-            df[col] = df[col].apply(lambda x: x.strip() if isinstance(x, str) else x)
-        
+            values = df[col].to_numpy()
+            values = np.array([value.strip() if type(value) is str else value for value in values], dtype=object)
+
+            if not self.legacy_preprocessing:
+                # Blank text cells become NaN if the rest of the column is numeric, "" otherwise
+                blank = pd.isna(values) | (values == "")
+                if not blank.all() and pd.api.types.infer_dtype(values[~blank], skipna=True) in NUMERIC_INFERRED_TYPES:
+                    values = pd.to_numeric(np.where(blank, np.nan, values))
+                else:
+                    values[blank] = ""
+            cleaned[col] = values
+
+        if cleaned:
+            df = df.copy(deep=False)
+            for col, values in cleaned.items():
+                df[col] = values
         return df
 
-    def worksheet_to_dataframe(self, sheet_index: int = None) -> pd.DataFrame:
+    def _cached(self, sheet_name: str, load: Callable[[], Any], **options) -> Any:
+        """Returns `load()` through the enabled caches: the shared in-memory one first, then the on-disk one."""
+        memory_key = None
+        if self.memory_cache:
+            memory_key = shared_sheet_cache.key(self.file_path, sheet_name, **options)
+            value = shared_sheet_cache.get(memory_key)
+            if value is not None:
+                return value
+
+        if self.sheet_cache is None:
+            value = load()
+        else:
+            disk_key = self.sheet_cache.key(self.file_path, sheet_name, **options)
+            value = self.sheet_cache.load(disk_key)
+            if value is None:
+                value = load()
+                self.sheet_cache.store(disk_key, value)
+
+        if memory_key is not None:
+            value = shared_sheet_cache.put(memory_key, value)
+        return value
+
+    @staticmethod
+    def _projection(columns: list | str | None = None, rows: list | str | None = None) -> dict:
+        """Normalizes column/row selections to hashable tuples of str (the read options of the readers and the caches)."""
+        options = {}
+        for name, selection in (("columns", columns), ("rows", rows)):
+            if selection is not None:
+                options[name] = (str(selection),) if isinstance(selection, (str, int)) else tuple(str(item) for item in selection)
+        return options
+
+    def _read_sheet(self, sheet_name: str, **options) -> pd.DataFrame:
+        """Parses and cleans a sheet, going through the caches when they are enabled."""
+        return self._cached(
+            sheet_name, 
+            lambda: self._preprocess_dataframe(self.workbook.parse(sheet_name, **options)), 
+            legacy_preprocessing=self.legacy_preprocessing,
+            **options
+        )
+
+    def worksheet_to_dataframe(
+        self, 
+        sheet_index: int = None, 
+        columns: list[str] | str | None = None, 
+        rows: list[str] | str | None = None
+    ) -> pd.DataFrame:
         """
         Reads a single worksheet and returns it as a cleaned DataFrame.
         
@@ -35,31 +182,313 @@ class ExcelDataExtractor():
         ----------
         sheet_index : int, optional
             The index of the worksheet to read. If not provided, the first sheet is used.
+        columns : list[str] or str, optional
+            Header names of the columns to read, kept in sheet order. The first column (the one holding the categories) 
+            is always kept. With the 'iterparse' reader, unselected columns are skipped while parsing; the pandas-based 
+            readers ('openpyxl', 'calamine') parse the whole sheet and project it afterwards.
+        rows : list[str] or str, optional
+            First-column values of the rows to read (plus the header), in sheet order. The 'iterparse' reader drops 
+            the other rows while streaming.
         """
-        sheet_names = pd.ExcelFile(self.file_path).sheet_names
-        sheet_name = sheet_names[sheet_index] if sheet_index is not None else sheet_names[0]
-        df = pd.read_excel(self.file_path, sheet_name=sheet_name)
-        return self._preprocess_dataframe(df)
+        sheet_name = self.sheet_names[sheet_index] if sheet_index is not None else self.sheet_names[0]
+        return self._read_sheet(sheet_name, **self._projection(columns, rows))
 
-    def worksheets_to_dataframes(self, include_first: bool = True) -> list[pd.DataFrame]:
+    def worksheets_to_dataframes(
+        self, 
+        include_first: bool = True, 
+        lazy: bool = True,
+        columns: list[str] | str | None = None, 
+        rows: list[str] | str | None = None
+    ) -> LazySheets | list[pd.DataFrame]:
         """
-        Reads all worksheets at once and returns a list of cleaned DataFrames.
+        Returns the worksheets as a list-like of cleaned DataFrames.
         
         Parameters
         ----------
         include_first : bool, optional
             Whether to include the first worksheet. By default, the first worksheet is skipped.
+        lazy : bool, optional
+            If True (default), returns a LazySheets: each sheet is parsed the first time it is indexed (slices parse
+            only the sliced sheets) and then kept. If False, parses every sheet now and returns a list.
+        columns, rows : list[str] or str, optional
+            Column and row selections applied to every sheet while reading (see `worksheet_to_dataframe`).
         """
-        dfs_dict = pd.read_excel(self.file_path, sheet_name=None) # This pandas funct returns a dictionary: {sheet_name: DataFrame}
-        # Select the sheet names based on whether the first sheet should be included
-        sheet_names = list(dfs_dict.keys())[1:] if not include_first else list(dfs_dict.keys()) 
-        return [self._preprocess_dataframe(dfs_dict[name]) for name in sheet_names]
+        # Select the sheet names based on whether the first sheet should be included (skipped sheets are never parsed)
+        sheet_names = self.sheet_names[1:] if not include_first else self.sheet_names
+        read_sheet = partial(self._read_sheet, **self._projection(columns, rows))
+        if lazy:
+            return LazySheets(sheet_names, read_sheet)
+        return [read_sheet(name) for name in sheet_names]
     
+    # Streaming methods
+    def _stream_sheet(self, sheet_index: int | None, columns: list[str] | str | None, rows: list[str] | str | None) -> Iterator[list]:
+        """
+        Yields the column names first, then every row holding data as a list (stripped strings, blanks as ""), read
+        lazily from the reader backend. Columns are those with a header cell, restricted to the projection; the key
+        column is the first of them.
+        """
+        sheet_name = self.sheet_names[sheet_index] if sheet_index is not None else self.sheet_names[0]
+        options = self._projection(columns, rows)
+        selected_columns = set(options["columns"]) if "columns" in options else None
+        selected_rows = set(options["rows"]) if "rows" in options else None
+
+        # Until the header is read every cell is converted; afterwards only the kept columns
+        header = None
+        kept_positions: set[int] = set()
+        def keep_column(position: int) -> bool:
+            return header is None or position in kept_positions
+
+        raw_rows = self.workbook.iter_rows(sheet_name, keep_column)
+        header = next(raw_rows, [])
+        names = header_names(header)
+        named = [position for position, value in enumerate(header) if key_text(value) != ""]
+        if not named:
+            return
+        kept = [
+            position for position in named 
+            if selected_columns is None or position == named[0] or key_text(names[position]) in selected_columns
+        ]
+        kept_positions.update(kept)
+        yield [names[position] for position in kept]
+
+        width = kept[-1] + 1
+        for values in raw_rows:
+            if len(values) < width:
+                values = values + [""] * (width - len(values))
+            row = [values[position].strip() if type(values[position]) is str else values[position] for position in kept]
+            if all(value == "" or (isinstance(value, float) and np.isnan(value)) for value in row):
+                continue  # Empty rows are dropped, as in `worksheet_to_dataframe`
+            if selected_rows is not None and key_text(row[0]) not in selected_rows:
+                continue
+            yield row
+
+    def iter_rows(
+        self, 
+        sheet_index: int = None, 
+        columns: list[str] | str | None = None, 
+        rows: list[str] | str | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Streams the rows of a worksheet as dicts (column name -> value) without loading the sheet, so memory does not 
+        depend on the number of rows. Strings are stripped, blank cells are None and empty rows are skipped.
+
+        Parameters
+        ----------
+        sheet_index : int, optional
+            The index of the worksheet to read. If not provided, the first sheet is used.
+        columns, rows : list[str] or str, optional
+            Column and row selections (see `worksheet_to_dataframe`). Unselected cells are not converted.
+
+        Notes
+        -----
+        Columns are taken from the header row, since the stream cannot look ahead: cells under an empty header are 
+        ignored and a named column without data is kept (as blanks), whereas `worksheet_to_dataframe` keeps or drops 
+        columns by their data. Streams bypass the caches.
+        """
+        stream = self._stream_sheet(sheet_index, columns, rows)
+        names = next(stream, None)
+        if names is None:
+            return
+        for row in stream:
+            yield {name: None if value == "" else value for name, value in zip(names, row)}
+
+    def iter_chunks(
+        self, 
+        sheet_index: int = None, 
+        chunk_size: int = 10_000,
+        columns: list[str] | str | None = None, 
+        rows: list[str] | str | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams a worksheet as cleaned DataFrames of at most `chunk_size` rows, for aggregations that must run in 
+        bounded memory over sheets too large to load at once.
+
+        Each chunk gets the same cleaning as `worksheet_to_dataframe` (stripped text, empty rows dropped, numeric 
+        columns kept numeric with NaN blanks) and the chunks' indexes continue each other, so `pd.concat(chunks)` 
+        rebuilds the sheet. Columns are taken from the header row (see `iter_rows`). The first chunk fixes the dtypes:
+        later chunks are cast to them where their values allow it (e.g. a text column is still text in a chunk that
+        only holds numbers).
+
+        Examples
+        --------
+        >>> totales = None
+        >>> for chunk in excel.iter_chunks(columns=["LONGITUD"]):
+        ...     parcial = chunk.groupby("DEPARTAMENTO")["LONGITUD"].sum()
+        ...     totales = parcial if totales is None else totales.add(parcial, fill_value=0)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        stream = self._stream_sheet(sheet_index, columns, rows)
+        names = next(stream, None)
+        if names is None:
+            return
+        start = 0
+        dtypes = None
+        while batch := list(islice(stream, chunk_size)):
+            chunk = self._clean_columns(rows_to_dataframe(batch, names=names))
+            if dtypes is None:
+                dtypes = chunk.dtypes
+            else:
+                chunk = self._align_dtypes(chunk, dtypes)
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+
+    @staticmethod
+    def _align_dtypes(chunk: pd.DataFrame, dtypes: pd.Series) -> pd.DataFrame:
+        """
+        Casts the columns of a later chunk to the dtypes of the first one, where the values allow it. Each chunk is
+        parsed on its own, so a text column holding only numbers or blanks in this chunk would otherwise come out
+        numeric, and a float column without blanks as int64.
+        """
+        aligned = {}
+        for position, dtype in enumerate(dtypes):
+            series = chunk.iloc[:, position]
+            if series.dtype == dtype:
+                continue
+            if dtype == object and series.dtype != object:
+                # Same values the whole-sheet cleaning keeps in a text column: integral numbers int, blanks ""
+                aligned[position] = np.array([raw_value(value) for value in series.tolist()], dtype=object)
+            elif dtype.kind == "f" and series.dtype.kind in "iub":
+                aligned[position] = series.astype(dtype)
+            elif dtype.kind in "mMf" and series.isna().all():
+                aligned[position] = series.astype(dtype)
+            # Otherwise the chunk holds values the first chunk's dtype cannot represent (text in a numeric column,
+            # blanks in an int64 one): it keeps its own dtype, which pd.concat upcasts like the whole-sheet parse
+        if aligned:
+            chunk = chunk.copy(deep=False)
+            for position, values in aligned.items():
+                chunk.isetitem(position, values)
+        return chunk
+
+    def aggregate(
+        self,
+        by: str | list[str],
+        values: str | list[str],
+        agg: Literal["sum", "mean", "count", "min", "max"] | dict[str, str] = "sum",
+        source: int | pd.DataFrame | None = None,
+        sort: Literal["ascending", "descending"] | None = None,
+        top: int | None = None,
+        chunk_size: int = 50_000,
+        rows: list[str] | str | None = None
+    ) -> pd.DataFrame:
+        """
+        Group-by aggregation computed in one streaming pass over a worksheet: partial aggregates of every chunk are 
+        merged at the end, and only the group and value columns are parsed.
+
+        Replaces `df.groupby(by)[values].sum().reset_index().sort_values(...)` on a fully loaded sheet.
+
+        Parameters
+        ----------
+        by : str or list[str]
+            Column(s) to group by. Rows with a blank key ("" in text columns or NaN) are dropped.
+        values : str or list[str]
+            Numeric column(s) to aggregate.
+        agg : {'sum', 'mean', 'count', 'min', 'max'} or dict, optional
+            Aggregation applied to every value column, or a mapping value column -> aggregation. Defaults to 'sum'.
+        source : int or pd.DataFrame, optional
+            Index of the worksheet to stream (the first one by default), or an already loaded DataFrame.
+        sort : {'ascending', 'descending'}, optional
+            Sorts the groups by the first value column. By default groups keep their order of first appearance.
+        top : int, optional
+            Keeps only the `top` groups with the largest first value column (then `sort` applies).
+        chunk_size : int, optional
+            Rows per streamed chunk (see `iter_chunks`). Defaults to 50 000.
+        rows : list[str] or str, optional
+            Row selection applied while reading (see `worksheet_to_dataframe`).
+
+        Returns
+        -------
+        pd.DataFrame
+            The group columns followed by the aggregated value columns.
+
+        Raises
+        ------
+        KeyError
+            If a group or value column is not found.
+        ValueError
+            If an aggregation is not supported.
+        TypeError
+            If a value column is not numeric (except for 'count').
+
+        Examples
+        --------
+        >>> excel.aggregate("DEPARTAMENTO", "LONGITUD", "sum", source=3, sort="ascending")
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        values = [values] if isinstance(values, str) else list(values)
+        aggs = agg if isinstance(agg, dict) else {value: agg for value in values}
+        if set(aggs) != set(values):
+            raise KeyError(f"The aggregations must cover exactly the value columns: {values}")
+        unsupported = {name for name in aggs.values() if name not in PARTIAL_AGGREGATIONS}
+        if unsupported:
+            raise ValueError(f"Unsupported aggregation(s): {sorted(unsupported)}. Use one of {list(PARTIAL_AGGREGATIONS)}")
+
+        if isinstance(source, pd.DataFrame):
+            chunks = [source]
+        else:
+            chunks = self.iter_chunks(source, chunk_size, columns=by + values, rows=rows)
+
+        # Partial aggregates per chunk (a mean is carried as its sum and count)
+        partial_specs = {
+            f"{value}__{partial}": (value, partial) for value in values for partial in PARTIAL_AGGREGATIONS[aggs[value]]
+        }
+        partials = []
+        for chunk in chunks:
+            missing_columns = [col for col in by + values if col not in chunk.columns]
+            if missing_columns:
+                raise KeyError(f"Column(s) not found in the worksheet, check typing: {missing_columns}")
+            for value in values:
+                if aggs[value] != "count" and not pd.api.types.is_numeric_dtype(chunk[value]):
+                    raise TypeError(f"Column '{value}' is not numeric and cannot be aggregated with '{aggs[value]}'")
+            # Cleaned text columns hold "" for blanks, which groupby would keep as a group of its own
+            blank_key = (chunk[by] == "").any(axis=1).to_numpy()
+            if blank_key.any():
+                chunk = chunk[~blank_key]
+            partials.append(chunk.groupby(by, sort=False).agg(**partial_specs))
+
+        if not partials:
+            return pd.DataFrame(columns=by + values)
+
+        # Merge the partial aggregates of every chunk
+        merged = pd.concat(partials).groupby(level=by, sort=False).agg(
+            **{name: (name, MERGE_AGGREGATIONS[partial]) for name, (_, partial) in partial_specs.items()}
+        )
+        result = pd.DataFrame(index=merged.index)
+        for value in values:
+            if aggs[value] == "mean":
+                result[value] = merged[f"{value}__sum"] / merged[f"{value}__count"]
+            else:
+                result[value] = merged[f"{value}__{aggs[value]}"]
+
+        if top is not None:
+            result = result.nlargest(top, values[0], keep="first")
+        if sort is not None:
+            result = result.sort_values(values[0], ascending=sort == "ascending", kind="stable")
+        return result.reset_index()
+
     # Transformation methods
+    @staticmethod
+    def _transpose(df: pd.DataFrame) -> pd.DataFrame:
+        """Swaps rows and columns: the headers become the first column and the first-column values the new headers."""
+        # A single NumPy transpose of the value block. Numeric blocks keep their (common) dtype; mixed blocks come out 
+        # as object, so each new column is re-inferred and numeric rows become numeric columns again
+        # The frame is built by a single constructor (one block per dtype), not by inserting into a fragmented one
+        values = df.iloc[:, 1:].to_numpy()
+        columns = pd.DataFrame(values.T)
+        if values.dtype == object:
+            columns = columns.infer_objects()
+        result = pd.DataFrame({-1: df.columns[1:].to_numpy(), **{position: columns[position] for position in columns.columns}})
+        result.columns = [df.columns[0]] + df.iloc[:, 0].tolist()  # Old headers, as the new key column
+        return result
+
     def normalize_orientation(self, dfs: pd.DataFrame | list[pd.DataFrame]) -> pd.DataFrame | list[pd.DataFrame]:
         """
         Normalizes the orientation of one or more DataFrames. If a single DataFrame is provided, it returns a single normalized DataFrame; if a list of DataFrames is provided, it returns a list of normalized DataFrames.
 
+        The headers become the first column and the first-column values become the headers. Numeric values keep numeric
+        dtypes (a row of numbers becomes a float64/int64 column, even when the other rows hold text).
+
         Parameters
         ----------
         dfs : pd.DataFrame or list of pd.DataFrame
@@ -75,19 +504,11 @@ class ExcelDataExtractor():
         ValueError
             If the input is neither a DataFrame nor a list of DataFrames.
         """
-        if not isinstance(dfs, (pd.DataFrame, list)):
+        if not isinstance(dfs, (pd.DataFrame, list, LazySheets)):
             raise ValueError("Must provide either a DataFrame or a list of DataFrames")
         if isinstance(dfs, pd.DataFrame):
             dfs= [dfs]
-        normalized_dfs = []
-        for df in dfs:
-            # If headers are not strings (categories), df will be transposed.
-            #if isinstance(df.iloc[0,1], str) and not df.shape[1] < 3: # Consider using as well if not isinstance(df.columns[1], str)
-            index_name = df.columns[0]
-            df = df.set_index(df.columns[0]).transpose() # Manually set another index, or else the default index stays on top
-            df.reset_index(inplace=True)
-            df.columns = [index_name] + df.columns[1:].tolist()  # I loathe pandas indexes
-            normalized_dfs.append(df)
+        normalized_dfs = [self._transpose(df) for df in dfs]
         
         # If a single DataFrame was passed, return just that DataFrame.
         if len(normalized_dfs) == 1:
@@ -98,7 +519,7 @@ class ExcelDataExtractor():
     # TODO: Raise KeyError if at least 1 selected category is not found
     def filter_data(
         self,
-        df: pd.DataFrame | list[pd.DataFrame],
+        df: pd.DataFrame | RowIndex | list[pd.DataFrame | RowIndex],
         selected_categories: list[str] | str,
         filter_out: bool = False,
         key: Literal["row", "column"] = "column"
@@ -111,8 +532,9 @@ class ExcelDataExtractor():
 
         Parameters
         ----------
-        df : pd.DataFrame or list[pd.DataFrame]
-            The DataFrame(s) to filter.
+        df : pd.DataFrame, RowIndex or list of them
+            The DataFrame(s) to filter. When the same frame is filtered by rows repeatedly, pass its `index_rows(df)` 
+            instead: the first column is then hashed once and each call only looks up the selected categories.
         selected_categories : list[str], optional
             A list of column names or row values to include/exclude. If `None`, no filtering is applied.
         filter_out : bool, default=False
@@ -152,13 +574,13 @@ class ExcelDataExtractor():
         Departamento  2014  2015
         0         Lima    10    11
         """
-        if not isinstance(df, pd.DataFrame) or isinstance(df, list):
-            raise TypeError(f"Invalid input. Accepted types: DataFrame or list")
+        if not isinstance(df, (pd.DataFrame, RowIndex, list, LazySheets)):
+            raise TypeError(f"Invalid input. Accepted types: DataFrame, RowIndex or list")
         
-        is_single_df = isinstance(df, pd.DataFrame)
-        dfs = [df] if is_single_df else df.copy()
+        is_single_df = isinstance(df, (pd.DataFrame, RowIndex))
+        dfs = [df] if is_single_df else list(df)
         
-        if not all(isinstance(df, pd.DataFrame) for df in dfs):
+        if not all(isinstance(df, (pd.DataFrame, RowIndex)) for df in dfs):
             raise TypeError(f"Invalid input. At least one element in the list is not a DataFrame")
         
         # Normalize selected_categories to list
@@ -173,6 +595,10 @@ class ExcelDataExtractor():
         
         filtered_dfs = []
         for df_item in dfs:
+            row_index = None
+            if isinstance(df_item, RowIndex):
+                row_index, df_item = df_item, df_item.frame
+
             if key == "column":
                 columns_as_str = [str(col) for col in df_item.columns[1:]]
                 missing_categories = [cat for cat in selected_categories if cat not in columns_as_str]
@@ -197,18 +623,17 @@ class ExcelDataExtractor():
                     raise KeyError(f"No columns in {selected_categories} matched.")
                     
             elif key == "row":
-                missing_categories = [cat for cat in selected_categories if cat not in df_item.iloc[:, 0].values]
+                # Hash lookups on the first column (built here if no prebuilt RowIndex was passed)
+                if row_index is None:
+                    row_index = RowIndex(df_item)
+                missing_categories = row_index.missing(selected_categories)
                 if missing_categories:
                     raise KeyError(
                         f"Row(s) not found in DataFrame, check typing: {missing_categories}. "
                         "Reminder: first column is always used for filtering rows")
 
-                # Crear máscara y ordenar
-                if not filter_out:
-                    result = df_item[df_item.iloc[:, 0].isin(selected_categories)]
-                    result = result.set_index(result.columns[0]).loc[selected_categories].reset_index()    
-                else:
-                    result = df_item[~df_item.iloc[:, 0].isin(selected_categories)]
+                # Seleccionar en el orden pedido, o excluir manteniendo el orden original
+                result = row_index.drop(selected_categories) if filter_out else row_index.take(selected_categories)
                 
                 if result.empty:
                     raise KeyError(f"No rows matched: {selected_categories}")
@@ -218,7 +643,92 @@ class ExcelDataExtractor():
         # Return single df if input was single, else return list
         return filtered_dfs[0] if is_single_df else filtered_dfs
 
+    def index_rows(self, dfs: pd.DataFrame | list[pd.DataFrame]) -> RowIndex | list[RowIndex]:
+        """
+        Builds a RowIndex (hash map of first-column value -> row positions) for one or more DataFrames, to be reused 
+        by every later `filter_data(..., key="row")` call on them.
+
+        Examples
+        --------
+        >>> indexed = excel.index_rows(df)
+        >>> for dpto in departamentos:
+        ...     df_dpto = excel.filter_data(indexed, [dpto, "Perú"], key="row")
+        """
+        if isinstance(dfs, pd.DataFrame):
+            return RowIndex(dfs)
+        return [RowIndex(df) for df in dfs]
+
     
+    def partition_data(
+        self,
+        df: pd.DataFrame | RowIndex | list[pd.DataFrame | RowIndex],
+        categories: list[str] | str | None = None,
+        keep: list[str] | str | None = None,
+        key: Literal["row", "column"] = "row"
+    ) -> dict[Any, pd.DataFrame] | list[dict[Any, pd.DataFrame]]:
+        """
+        Splits DataFrame(s) by category in a single pass, so a loop over departments becomes dictionary lookups.
+
+        `partition_data(df, departamentos, keep="Perú")[dpto]` equals `filter_data(df, [dpto, "Perú"], key=key)`,
+        but the first column is hashed once for all the categories instead of being scanned once per category.
+
+        Parameters
+        ----------
+        df : pd.DataFrame, RowIndex or list of them
+            The DataFrame(s) to split.
+        categories : list[str] or str, optional
+            Categories to split by (row values of the first column, or column names). If `None`, every distinct 
+            first-column value (key="row") or every column after the first (key="column") not in `keep`.
+        keep : list[str] or str, optional
+            Categories added to every partition after its own (e.g. a national total to compare against).
+        key : {"row", "column"}, default="row"
+            Whether categories are rows (based on the first column) or columns.
+
+        Returns
+        -------
+        dict or list[dict]
+            Category -> DataFrame, in the order of `categories`. Returns one mapping per input DataFrame if a list 
+            was passed.
+
+        Raises
+        ------
+        KeyError
+            If at least one category (or kept category) is not found in the df.
+        ValueError
+            If key is not "row" or "column".
+
+        Examples
+        --------
+        >>> partitions = excel.partition_data(dfs[2], departamentos, keep="Total")
+        >>> for dpto in departamentos:
+        ...     df_dpto = partitions[dpto]
+        """
+        if key not in ("row", "column"):
+            raise ValueError('key must be "row" or "column"')
+        if isinstance(df, (list, LazySheets)):
+            return [self.partition_data(df_item, categories, keep, key) for df_item in df]
+
+        keep = [] if keep is None else [str(category) for category in ([keep] if isinstance(keep, (str, int)) else keep)]
+        if categories is not None:
+            categories = [str(category) for category in ([categories] if isinstance(categories, (str, int)) else categories)]
+
+        if key == "column":
+            frame = df.frame if isinstance(df, RowIndex) else df
+            if categories is None:
+                categories = [str(col) for col in frame.columns[1:] if str(col) not in keep]
+            # Column selections never scan the rows
+            return {category: self.filter_data(frame, [category] + keep, key="column") for category in categories}
+
+        row_index = df if isinstance(df, RowIndex) else RowIndex(df)
+        if categories is None:
+            categories = [category for category in row_index.categories if str(category) not in keep]
+        missing_categories = row_index.missing(categories + keep)
+        if missing_categories:
+            raise KeyError(
+                f"Row(s) not found in DataFrame, check typing: {missing_categories}. "
+                "Reminder: first column is always used for filtering rows")
+        return {category: row_index.take([category] + keep) for category in categories}
+
     def concat_dataframes(
         self, 
         df1: pd.DataFrame,
@@ -271,7 +781,8 @@ class ExcelDataExtractor():
         Returns
         -------
         pd.DataFrame
-            DataFrame resultante con todos los datos combinados.
+            DataFrame resultante con todos los datos combinados: conserva las filas (y el orden) del primer DataFrame
+            y cada columna de datos lleva el nombre de su DataFrame. Los DataFrames de entrada no se modifican.
 
         Raises
         ------
@@ -293,55 +804,95 @@ class ExcelDataExtractor():
             if df.columns[0] != first_col:
                 raise KeyError(f"Todos los DataFrames deben tener el mismo nombre para la primera columna")
         
-        # Renombrar las columnas para evitar duplicados
-        for i, df in enumerate(dfs):
-            df.columns = [f"{col}_{df_names[i]}" if col != first_col else col for col in df.columns]
-        
-        # Procesar cada DataFrame añadiendo la fila de tipo
-        processed_dfs = []
-        for df, name in zip(dfs, df_names):
-            processed_df = pd.concat([
-                df,
-                pd.DataFrame([['Tipo'] + [name] * (len(df.columns)-1)], columns=df.columns)
-            ]).reset_index(drop=True)
-            processed_dfs.append(processed_df)
-
-        # Guardar orden original
-        column_order = processed_dfs[0].iloc[:, 0].tolist()
-
-        # Realizar el merge de todos los DataFrames
-        result_df = processed_dfs[0]
-        for df in processed_dfs[1:]:
-            result_df = pd.merge(
-                result_df,
-                df,
-                on=first_col,
-                how='outer',
-                suffixes=('_left', '_right')
-            )
-
-        # Convertir la fila Tipo en los nombres de las columnas
-        tipo_row = result_df[result_df.iloc[ :,0] == 'Tipo'].iloc[0]
-        nombre_original = result_df.columns[0]
-        result_df.columns = tipo_row
-        result_df.columns.values[0] = nombre_original
-
-        # Preservar orden original
-        result_df = result_df.set_index(result_df.columns[0]).reindex(column_order).reset_index()
-
-        # Eliminar la fila "Tipo"
-        result_df = result_df[result_df.iloc[:, 0] != 'Tipo'].reset_index(drop=True)
+        # Alinear todos los DataFrames a la vez sobre las categorías del primero (sin modificar los originales)
+        categories = dfs[0].iloc[:, 0]
+        blocks = [df.set_index(df.columns[0]).reindex(categories) for df in dfs]
+        result_df = pd.concat(blocks, axis=1, keys=df_names)  # Columns: MultiIndex (name, original column)
+
+        # Cada columna toma el nombre de su DataFrame
+        result_df.columns = [name for name, _ in result_df.columns]
+        result_df = result_df.reset_index()
+        result_df.columns = [first_col] + result_df.columns[1:].tolist()
         
         return result_df
 
     # Writing methods (simple)
+    @staticmethod
+    def _plain_columns(df: pd.DataFrame) -> list[list] | None:
+        """
+        Column values ready for xlsxwriter's `write_row` (NaN/NaT/NA as None, infinities as pandas' "inf" text), or None 
+        if the frame needs pandas' own writer (MultiIndex headers, or dates/times that need a number format).
+        """
+        if isinstance(df.columns, pd.MultiIndex):
+            return None
+        columns = []
+        for _, series in df.items():
+            if series.dtype.kind in "mM":
+                return None
+            values = series.to_numpy(dtype=object)  # Python scalars, as xlsxwriter expects
+            if series.dtype.kind == "O":
+                inferred = pd.api.types.infer_dtype(values, skipna=True)
+                if inferred not in PLAIN_INFERRED_TYPES:
+                    return None
+                if inferred.startswith("mixed") and any(isinstance(value, DATE_TYPES) for value in values):
+                    return None
+            values[pd.isna(values)] = None
+            values = values.tolist()
+            if np.inf in values or -np.inf in values:
+                values = [INFINITY_TEXT.get(value, value) if isinstance(value, float) else value for value in values]
+            columns.append(values)
+        return columns
+
+    def _export_dataframes(
+        self,
+        dfs: list[pd.DataFrame],
+        sheet_names: list[str],
+        output_file_path: str,
+        skip_first: bool,
+        engine: Literal["xlsxwriter", "openpyxl"]
+    ) -> None:
+        if engine not in ("xlsxwriter", "openpyxl"):
+            raise ValueError('engine must be "xlsxwriter" or "openpyxl"')
+        if engine == "openpyxl":
+            with pd.ExcelWriter(output_file_path, engine='openpyxl', mode='w') as writer:
+                # If skip_first is True, create an empty sheet as the first one
+                if skip_first:
+                    pd.DataFrame().to_excel(writer, sheet_name='Índice')
+                for df, sheet_name in zip(dfs, sheet_names):
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+            return
+
+        # Plain frames are written row by row through xlsxwriter directly (same cells and header style as to_excel). 
+        # If every frame is plain, rows are streamed to disk (constant_memory); pandas' writer needs random access.
+        # Text that looks like a URL or a formula is kept as text, as read from the source workbook
+        plain = [self._plain_columns(df) for df in dfs]
+        options = {'constant_memory': all(columns is not None for columns in plain), 'strings_to_urls': False, 'strings_to_formulas': False}
+        with pd.ExcelWriter(output_file_path, engine='xlsxwriter', engine_kwargs={'options': options}) as writer:
+            workbook = writer.book
+            if skip_first:
+                workbook.add_worksheet('Índice')
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+
+            for df, columns, sheet_name in zip(dfs, plain, sheet_names):
+                if columns is None:
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+                    continue
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, df.columns.tolist(), header_format)
+                for row_number, row in enumerate(zip(*columns), start=1):
+                    if worksheet.write_row(row_number, 0, row):
+                        # write_row stops at a rejected (or truncated) cell: the whole row is written cell by cell
+                        for col_number, value in enumerate(row):
+                            worksheet.write(row_number, col_number, value)
+
     def dataframe_to_worksheet(
         self,
         df: pd.DataFrame, 
         output_name: str, 
         output_path: str, 
         sheet_name: str = 'Hoja1', 
-        folder: str = "otros"
+        folder: str = "otros",
+        engine: Literal["xlsxwriter", "openpyxl"] = "xlsxwriter"
     ) -> None:
         """Writes a DataFrame to a worksheet in the Excel file.
 
@@ -353,10 +904,12 @@ class ExcelDataExtractor():
             The name of the worksheet. Defaults to 'Hoja1'.
         folder : str, optional
             The name of the folder inside "products". Defaults to "otros".
+        engine : {'xlsxwriter', 'openpyxl'}, optional
+            Defaults to 'xlsxwriter', which streams plain frames row by row (several times faster than building 
+            openpyxl's in-memory workbook). The cell values are the same with both engines.
         """
         output_file_path = os.path.join(output_path, folder, f'{output_name}.xlsx')
-        with pd.ExcelWriter(output_file_path, engine='openpyxl', mode='w') as writer:
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
+        self._export_dataframes([df], [sheet_name], output_file_path, skip_first=False, engine=engine)
         
     def dataframes_to_worksheets(
         self,
@@ -365,7 +918,8 @@ class ExcelDataExtractor():
         output_path: str,
         sheet_names: list[str] = None, 
         skip_first: bool = True,
-        folder: str = True
+        folder: str = "otros",
+        engine: Literal["xlsxwriter", "openpyxl"] = "xlsxwriter"
     ) -> None:
         """Writes multiple DataFrames to multiple worksheets in the Excel file.
 
@@ -376,9 +930,11 @@ class ExcelDataExtractor():
         sheet_names : list[str], optional
             A list of worksheet names. If not provided, default names will be used.
         skip_first : bool, optional
-            Whether to start writing from Worksheet 2 onward. Defaults to True.
+            Whether to start writing from Worksheet 2 onward (the first one is an empty 'Índice' sheet). Defaults to True.
         folder : str, optional
             The name of the folder inside "products". Defaults to "otros".
+        engine : {'xlsxwriter', 'openpyxl'}, optional
+            Writer engine (see `dataframe_to_worksheet`). Defaults to 'xlsxwriter'.
         """
         if sheet_names is None:
             sheet_names = [f'Hoja{i+1}' for i in range(len(dfs))]  # Default sheet names: Hoja1, Hoja2, etc.
@@ -388,14 +944,6 @@ class ExcelDataExtractor():
 
         output_file_path = os.path.join(output_path, folder, f'{output_name}.xlsx')
         os.makedirs(os.path.dirname(output_file_path), exist_ok= True)
-
-        with pd.ExcelWriter(output_file_path, engine='openpyxl', mode='w') as writer:
-            # If skip_first is True, create an empty sheet as the first one
-            if skip_first:
-                pd.DataFrame().to_excel(writer, sheet_name='Índice')
-
-            # Write DataFrames to subsequent sheets
-            for df, sheet_name in zip(dfs, sheet_names):
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        self._export_dataframes(list(dfs), sheet_names, output_file_path, skip_first, engine)
    
     # TODO: Use sheet index instead of name
@@ -1,13 +1,47 @@
 import pandas as pd
-from ..utils import Color, Formats
+from ..utils import Color, Formats, FormatRegistry, classify_numeric, text_metrics
 from xlsxwriter.workbook import Workbook
 from xlsxwriter.worksheet import Worksheet
+from xlsxwriter.utility import xl_rowcol_to_cell
 import numpy as np
-import copy
+from itertools import groupby
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+
+# Properties that Excel conditional formats (dxf records) can override
+CONDITIONAL_PROPERTIES = {'bold', 'italic', 'underline', 'font_strikeout', 'font_color', 'bg_color', 'fg_color', 'pattern', 'num_format'}
+BORDER_SIDES = ('top', 'bottom', 'left', 'right')
+# Header style of pandas' to_excel, so plain exports look the same with and without constant_memory
+PLAIN_HEADER = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+
+@dataclass(frozen=True)
+class FormatPlan:
+    """
+    Schema-level decisions of a formatting template, compiled once and reused for every DataFrame with the same
+    column names, dtypes and number format: named cell format properties, static column widths and template settings.
+    """
+    template: str
+    formats: dict[str, dict]
+    column_widths: tuple[tuple, ...]
+    settings: dict[str, Any] = field(default_factory=dict)
+
+
+# Process-wide LRU cache of compiled plans, keyed by (template, column names, dtypes, num_format, config)
+MAX_FORMAT_PLANS = 256
+_FORMAT_PLANS: OrderedDict[tuple, FormatPlan] = OrderedDict()
 
 
 class ExcelFormatter:
-    def __init__(self, df_list: list[pd.DataFrame], writer: pd.ExcelWriter):
+    def __init__(
+        self, 
+        df_list: list[pd.DataFrame], 
+        writer: pd.ExcelWriter, 
+        format_registry: FormatRegistry | None = None, 
+        conditional_formatting: bool = False
+    ):
         """
         Class for applying custom formatting to Excel worksheets created with pandas.
         Depends from ExcelWriterXL class.
@@ -18,6 +52,11 @@ class ExcelFormatter:
             List of pandas DataFrames that will be formatted
         writer : pd.ExcelWriter
             ExcelWriter object with xlsxwriter engine
+        format_registry : FormatRegistry, optional
+            Workbook-scoped format cache shared with the writer. A new one is created if not provided.
+        conditional_formatting : bool, optional
+            If True, row banding (text_table, index), highlighted rows and the thousands mask (data_table)
+            are expressed as worksheet-level conditional formats, and each column is written with a single format.
             
         Attributes
         ----------
@@ -27,256 +66,479 @@ class ExcelFormatter:
             The Excel writer object injected from ExcelWriterXL
         format : Formats
             Object containing predefined format configurations
+        format_registry : FormatRegistry
+            Cache that hands back the same Format object for identical properties
         """
         self.df_list = df_list
         self.writer = writer
         self.workbook: Workbook = self.writer.book
         self.format = Formats()
-        
+        self.format_registry = format_registry if format_registry is not None else FormatRegistry(self.workbook)
+        self.conditional_formatting = conditional_formatting
+        self._column_widths: dict[tuple[str, int], float] = {}
+
+    @staticmethod
+    def _column_values(df: pd.DataFrame) -> list[list]:
+        """Extracts every column once as a list of native Python values (avoids per-cell df.iloc access)."""
+        return [df.iloc[:, col_idx].tolist() for col_idx in range(df.shape[1])]
+
+    @staticmethod
+    def _format_runs(formats: list) -> list[tuple[int, int, object]]:
+        """Splits a list of formats into (start, length, format) runs of consecutive equal formats."""
+        runs, start = [], 0
+        for cell_format, run in groupby(formats):
+            run_length = sum(1 for _ in run)
+            runs.append((start, run_length, cell_format))
+            start += run_length
+        return runs
+
+    def _write_body(self, worksheet: Worksheet, columns: list[list], formats: list, first_row: int = 1):
+        """
+        Writes the table body. `formats[col]` is either a single Format for the whole column or a per-row list.
+        Cells are emitted in batches (`write_column`/`write_row`) of consecutive cells sharing the same format.
+        In constant_memory mode rows are emitted strictly in order, as xlsxwriter flushes each row once a later one is written.
+        """
+        if not columns:
+            return
+        column_formats = [
+            cell_format if isinstance(cell_format, list) else [cell_format] * len(columns[0])
+            for cell_format in formats
+        ]
+        if not self.workbook.constant_memory:
+            for col_idx, (values, cell_formats) in enumerate(zip(columns, column_formats)):
+                for start, length, cell_format in self._format_runs(cell_formats):
+                    run = values[start:start + length]
+                    if worksheet.write_column(first_row + start, col_idx, run, cell_format):
+                        self._write_cells(worksheet, first_row + start, col_idx, run, cell_format, by_row=False)
+        else:
+            for row_offset, (values, cell_formats) in enumerate(zip(zip(*columns), zip(*column_formats))):
+                for start, length, cell_format in self._format_runs(list(cell_formats)):
+                    run = values[start:start + length]
+                    if worksheet.write_row(first_row + row_offset, start, run, cell_format):
+                        self._write_cells(worksheet, first_row + row_offset, start, run, cell_format, by_row=True)
+
+    @staticmethod
+    def _write_cells(worksheet: Worksheet, row: int, col: int, values: list | tuple, cell_format, by_row: bool):
+        """
+        Writes a run cell by cell. Used after `write_column`/`write_row` returned an error code: they stop at the
+        rejected (or truncated) cell, so the cells after it would otherwise be missing. Text that `write` rejects 
+        (e.g. a URL longer than Excel's hyperlink limit) is written as a plain string instead.
+        """
+        for offset, value in enumerate(values):
+            cell_row, cell_col = (row, col + offset) if by_row else (row + offset, col)
+            if worksheet.write(cell_row, cell_col, value, cell_format) and isinstance(value, str):
+                worksheet.write_string(cell_row, cell_col, value, cell_format)
 
-    def apply_database_format(self, worksheet: Worksheet, df: pd.DataFrame, num_format: str):
-        """Applies formatting only to cells with data."""
+    def _banded_formats(self, n_rows: int, first_row: int, formats: tuple) -> list:
+        """Alternates between two formats per row (even data rows, counted from the first one, use the first format)."""
+        return [formats[band_id] for band_id in ((np.arange(n_rows) + first_row - 1) % 2).tolist()]
 
-        ### Basic configurations
+    @staticmethod
+    def _set_row_heights(worksheet: Worksheet, first_row: int, n_rows: int, height: float):
+        """
+        Gives `n_rows` rows starting at `first_row` the same height, with one set_row() record per row.
+        The sheet's default row height is left alone: notes, charts or further tables written below the block
+        keep the standard height. Using the default row height for the block would not make the sheet smaller
+        either: xlsxwriter writes `ht`/`customHeight` on every row whose height differs from 15, default or not.
+        """
+        if n_rows == 0 or height == worksheet.default_row_height:
+            return
+        for row_idx in range(first_row, first_row + n_rows):
+            worksheet.set_row(row_idx, height)
+
+    @staticmethod
+    def _expand_borders(properties: dict) -> dict:
+        """Replaces 'border'/'border_color' with their per-side equivalents (explicit sides take precedence)."""
+        expanded = {key: value for key, value in properties.items() if key not in ('border', 'border_color')}
+        for side in BORDER_SIDES:
+            expanded.setdefault(side, properties.get('border', 0))
+            expanded.setdefault(f'{side}_color', properties.get('border_color'))
+        return expanded
+
+    def _conditional_overlay(self, base: dict, target: dict) -> dict:
+        """Properties a conditional format must add on top of `base` cells so they look like `target` cells."""
+        base, target = self._expand_borders(base), self._expand_borders(target)
+        overlay = {key: value for key, value in target.items() if key in CONDITIONAL_PROPERTIES and base.get(key) != value}
+        for side in BORDER_SIDES:
+            if target[side] and (target[side], target[f'{side}_color']) != (base[side], base[f'{side}_color']):
+                overlay[side] = target[side]
+                overlay[f'{side}_color'] = target[f'{side}_color']
+        return overlay
+
+    def _write_banded_body(self, worksheet: Worksheet, df: pd.DataFrame, first_row: int, plan: FormatPlan):
+        """
+        Writes a table body alternating two formats per row (even data rows use the '_even' formats of the plan).
+        With conditional_formatting, cells get the odd-row format and even rows are restyled by a MOD(ROW(),2) rule.
+        """
+        n_rows, n_cols = df.shape
+        formats = plan.formats
+        if not self.conditional_formatting:
+            first_column = self._banded_formats(n_rows, first_row, (self.format_registry.get(formats['first_column_even']), self.format_registry.get(formats['first_column_odd'])))
+            data = self._banded_formats(n_rows, first_row, (self.format_registry.get(formats['data_even']), self.format_registry.get(formats['data_odd'])))
+            self._write_body(worksheet, self._column_values(df), [first_column] + [data] * (n_cols - 1), first_row)
+            return
+
+        body_formats = [self.format_registry.get(formats['first_column_odd'])] + [self.format_registry.get(formats['data_odd'])] * (n_cols - 1)
+        self._write_body(worksheet, self._column_values(df), body_formats, first_row)
+        if n_rows == 0:
+            return
+        # Data row 0 is on Excel row 2, hence even ROW() values are the even data rows
+        last_row = first_row + n_rows - 1
+        worksheet.conditional_format(first_row, 0, last_row, 0, {
+            'type': 'formula', 'criteria': '=MOD(ROW(),2)=0',
+            'format': self.format_registry.get(self._conditional_overlay(formats['first_column_odd'], formats['first_column_even']))
+        })
+        if n_cols > 1:
+            worksheet.conditional_format(first_row, 1, last_row, n_cols - 1, {
+                'type': 'formula', 'criteria': '=MOD(ROW(),2)=0',
+                'format': self.format_registry.get(self._conditional_overlay(formats['data_odd'], formats['data_even']))
+            })
+
+    @staticmethod
+    def _category_criteria(first_cell: str, categories: list) -> str:
+        """Excel formula that is true when `first_cell` equals any of `categories`."""
+        conditions = [
+            f'{first_cell}="{category.replace(chr(34), chr(34) * 2)}"' if isinstance(category, str) else f'{first_cell}={category}'
+            for category in categories
+        ]
+        return f"=OR({','.join(conditions)})"
+
+    @staticmethod
+    def _write_header(worksheet: Worksheet, df: pd.DataFrame, cell_format, first_row: int):
+        """Writes the header row, only for the first chunk of a sheet (data starting right below it)."""
+        if first_row == 1:
+            worksheet.write_row(0, 0, df.columns.tolist(), cell_format)
+
+
+    def compile_plan(
+        self,
+        template: Literal["database", "index", "data_table", "text_table", "report"],
+        df: pd.DataFrame,
+        num_format: str = "",
+        config: dict | None = None
+    ) -> FormatPlan:
+        """
+        Returns the FormatPlan of `template` for the schema of `df` (column names and dtypes), `num_format` and `config`.
+        Plans are cached process-wide (the `MAX_FORMAT_PLANS` most recently used), so building the same layout for many departments compiles it only once;
+        per-cell decisions (thousands mask, highlighted rows, widths from the data) are still taken per DataFrame.
+
+        Parameters
+        ----------
+        template : {'database', 'index', 'data_table', 'text_table', 'report'}
+            Formatting template
+        df : pd.DataFrame
+            A DataFrame with the schema the plan is compiled for
+        num_format : str, optional
+            Number format string for numeric cells
+        config : dict, optional
+            Template overrides (only used by "report")
+
+        Returns
+        -------
+        FormatPlan
+            The cached or newly compiled plan
+        """
+        signature = (
+            template,
+            tuple(str(column) for column in df.columns),
+            tuple(str(dtype) for dtype in df.dtypes),
+            num_format,
+            FormatRegistry._freeze(config),
+        )
+        plan = _FORMAT_PLANS.get(signature)
+        if plan is not None:
+            _FORMAT_PLANS.move_to_end(signature)
+            return plan
+        plan = getattr(self, f"_compile_{template}_plan")(df, num_format, config)
+        _FORMAT_PLANS[signature] = plan
+        if len(_FORMAT_PLANS) > MAX_FORMAT_PLANS:
+            _FORMAT_PLANS.popitem(last=False)
+        return plan
+
+    def _compile_database_plan(self, df: pd.DataFrame, num_format: str, config: dict | None) -> FormatPlan:
         fmt = self.format.cells['database']
-        fmt['data']['num_format'] = num_format
+        data = {**fmt['data'], 'num_format': num_format}
+        column_widths = list(fmt["column_widths"].items())
+        if len(df.columns) > 1:
+            column_widths.append((1, len(df.columns) - 1, 14 if len(str(df.columns[1])) > 11 else 10))
+        return FormatPlan(
+            template='database',
+            formats={
+                'header': fmt['header'],
+                'first_column': fmt['first_column'],
+                'date': {**fmt['first_column'], 'num_format': 'mmm-yy'},
+                'data': data,
+                'data_thousands': {**data, 'num_format': "# ### ##" + num_format},
+            },
+            column_widths=tuple(column_widths)
+        )
+
+    def _compile_banded_plan(self, template: str, first_column_even: dict, first_column_odd: dict, data_even: dict, data_odd: dict) -> FormatPlan:
+        fmt = self.format.cells[template]
+        return FormatPlan(
+            template=template,
+            formats={
+                'header': fmt['header'],
+                'first_column_even': first_column_even,
+                'first_column_odd': first_column_odd,
+                'data_even': data_even,
+                'data_odd': data_odd,
+            },
+            column_widths=tuple(fmt["column_widths"].items())
+        )
+
+    def _compile_text_table_plan(self, df: pd.DataFrame, num_format: str, config: dict | None) -> FormatPlan:
+        fmt = self.format.cells['text_table']
+        gray_format = {**fmt['first_column'], 'right': 0}
+        white_format = {**fmt['data'], 'right': 0}
+        return self._compile_banded_plan(
+            'text_table',
+            first_column_even={**gray_format, 'bold': True, 'align': 'left', 'left': 0},
+            first_column_odd={**white_format, 'bold': True, 'align': 'left', 'left': 0},
+            data_even=gray_format,
+            data_odd=white_format
+        )
+
+    def _compile_index_plan(self, df: pd.DataFrame, num_format: str, config: dict | None) -> FormatPlan:
+        fmt = self.format.cells['index']
+        gray_format = {**fmt['first_column']}
+        white_format = {**fmt['data'], 'right': 0}
+        return self._compile_banded_plan(
+            'index',
+            first_column_even={**gray_format, 'bold': True, 'align': 'left'},
+            first_column_odd={**white_format, 'bold': True, 'align': 'left'},
+            data_even=gray_format,
+            data_odd=white_format
+        )
+
+    def _compile_data_table_plan(self, df: pd.DataFrame, num_format: str, config: dict | None) -> FormatPlan:
+        fmt = self.format.cells['data_table']
+        data = {**fmt['data'], 'num_format': num_format}
+        highlighted_row = {'bg_color': Color.BLUE_LIGHT, 'bold': True}
+        thousands = {'num_format': "# ### ##" + num_format}
+        # Columnas restantes (años y Var (%))
+        num_columns = df.shape[1] - 1 
+        return FormatPlan(
+            template='data_table',
+            formats={
+                'header': fmt['header'],
+                'first_column': fmt['first_column'],
+                'first_column_highlighted': {**fmt['first_column'], **highlighted_row},
+                # Data formats are indexed by format id: +1 thousands mask, +2 highlighted row
+                'data': data,
+                'data_thousands': {**data, **thousands},
+                'data_highlighted': {**data, **highlighted_row},
+                'data_thousands_highlighted': {**data, **thousands, **highlighted_row},
+                # Conditional format overlays
+                'highlighted_row': highlighted_row,
+                'thousands': thousands,
+            },
+            column_widths=tuple(fmt["column_widths"].items()),
+            settings={
+                'base_width': 8.0 if num_columns <= 5 else (6.0 if num_columns <= 8 else 5.2),
+                'handicap': 0 if num_format == 0 else (2.3 if num_format in ('0.0', '0,0%') else 3.3),
+            }
+        )
+
+    def _compile_report_plan(self, df: pd.DataFrame, num_format: str, config: dict | None) -> FormatPlan:
+        fmt = {**self.format.cells['report'], **(config or {})}
+        return FormatPlan(
+            template='report',
+            formats={
+                'header': fmt['header'],
+                'first_column': fmt['first_column'],
+                'data': fmt['data'],
+            },
+            column_widths=tuple(fmt.get("column_widths", {}).items())
+        )
+
+    def _apply_plan_layout(self, worksheet: Worksheet, plan: FormatPlan):
+        """Applies the static, schema-level parts of a plan (gridlines and column widths)."""
         worksheet.hide_gridlines(2)
+        for column_width in plan.column_widths:
+            worksheet.set_column(*column_width)
 
-        ### Widths and heights
-        for column, width in fmt["column_widths"].items():
-            worksheet.set_column(column, width)
 
-        if len(df.columns) > 1:
-            if len(str(df.columns[1])) > 11:
-                worksheet.set_column(1, len(df.columns) - 1, 14)
-            else:
-                worksheet.set_column(1, len(df.columns) - 1, 10)
+    def apply_database_format(self, worksheet: Worksheet, df: pd.DataFrame, num_format: str, first_row: int = 1):
+        """Applies formatting only to cells with data."""
+
+        ### Basic configurations, widths and heights
+        plan = self.compile_plan('database', df, num_format)
+        formats = plan.formats
+        self._apply_plan_layout(worksheet, plan)
 
         ### Writing
-        # Write data cells with appropriate formats
-        for row_idx in range(df.shape[0]):
-            cell_value = df.iloc[row_idx, 0]
-            # First column (e.g., dates or text)
-            if isinstance(cell_value, pd.Timestamp): 
-                try: 
-                    date_value = pd.to_datetime(cell_value)
-                    excel_date = (date_value - pd.Timestamp("1899-12-30")).days
-                    date_fmt = fmt['first_column']
-                    date_fmt['num_format'] = 'mmm-yy'
-                    worksheet.write(row_idx + 1, 0, excel_date, self.workbook.add_format(date_fmt))
-                except ValueError:
-                    worksheet.write(row_idx + 1, 0, cell_value, self.workbook.add_format(fmt['first_column']))
-            else:
-                worksheet.write(row_idx + 1, 0, cell_value, self.workbook.add_format(fmt['first_column']))
-
-            # Rest of columns (numeric data)
-            for col_idx in range(1, df.shape[1]):
-                cell_value = df.iloc[row_idx, col_idx]
-                fmt_modified = copy.deepcopy(fmt["data"])
-                try:
-                    if int(cell_value) > 9999:
-                        fmt_modified['num_format'] = "# ### ##" + num_format
-                except ValueError:
-                    pass
-
-                # Skip NaN/Inf values by checking if the value is NaN or Inf
-                if pd.isna(cell_value) or (isinstance(cell_value, (int, float)) and np.isinf(cell_value)):
-                    worksheet.write(row_idx + 1, col_idx, '')  # Write an empty cell
-                else:
-                    worksheet.write(row_idx + 1, col_idx, cell_value, self.workbook.add_format(fmt_modified))
-        
         # Headers
-        for col_num, col_name in enumerate(df.columns):
-            worksheet.write(0, col_num, col_name, self.workbook.add_format(fmt["header"]))
+        self._write_header(worksheet, df, self.format_registry.get(formats["header"]), first_row)
+
+        columns = self._column_values(df)
+        first_column_format = self.format_registry.get(formats['first_column'])
+        date_format = self.format_registry.get(formats['date'])
+        data_formats = (self.format_registry.get(formats['data']), self.format_registry.get(formats['data_thousands']))
+
+        # First column (e.g., dates or text)
+        first_values, first_formats = [], []
+        for cell_value in columns[0]:
+            if isinstance(cell_value, pd.Timestamp):
+                first_values.append((cell_value - pd.Timestamp("1899-12-30")).days)
+                first_formats.append(date_format)
+            else:
+                first_values.append(cell_value)
+                first_formats.append(first_column_format)
+        body_values, body_formats = [first_values], [first_formats]
+
+        # Rest of columns (numeric data). NaN/Inf values are written as empty (but formatted) cells
+        for col_idx in range(1, df.shape[1]):
+            masks = classify_numeric(df.iloc[:, col_idx])
+            body_values.append(['' if is_blank else value for value, is_blank in zip(columns[col_idx], masks.blank.tolist())])
+            body_formats.append([data_formats[needs_mask] for needs_mask in masks.thousands.tolist()])
+        self._write_body(worksheet, body_values, body_formats, first_row)
     
      # TODO: Try if df.iloc[0,1] has a '-' 
-    def apply_text_table_format(self, worksheet: Worksheet, df: pd.DataFrame, num_format: str):
+    def apply_text_table_format(self, worksheet: Worksheet, df: pd.DataFrame, num_format: str, first_row: int = 1):
         """Applies formatting only to cells with data."""
 
-        ### Basic configurations
-        worksheet.hide_gridlines(2)
-        fmt = self.format.cells['text_table']
-
-        ### Widths and heights
-        for column, width in fmt["column_widths"].items():
-            worksheet.set_column(column, width)
+        ### Basic configurations, widths and heights
+        plan = self.compile_plan('text_table', df, num_format)
+        self._apply_plan_layout(worksheet, plan)
         worksheet.set_row(0, 29)
 
-
         ### Writing
         # Write headers with header format
-        for col_num, col_name in enumerate(df.columns):
-            worksheet.write(0, col_num, col_name, self.workbook.add_format(fmt['header']))
-
-        # Modify base formats
-        gray_format = {**fmt['first_column'], 'right': 0}
-        gray_bold_format = {**gray_format, 'bold': True, 'align': 'left', 'left': 0}
-        white_format = {**fmt['data'], 'right': 0}
-        white_bold_format = {**white_format, 'bold': True, 'align': 'left', 'left': 0}
+        self._write_header(worksheet, df, self.format_registry.get(plan.formats['header']), first_row)
         
         # Write table contents with alternating colors and bold for first column
-        for row_idx in range(df.shape[0]):
-            for col_idx in range(df.shape[1]):
-                cell_value = df.iloc[row_idx, col_idx]
-
-                # Select format based on column and row index
-                if col_idx == 0:
-                    cell_format = self.workbook.add_format(gray_bold_format) if row_idx % 2 == 0 else self.workbook.add_format(white_bold_format)
-                else:
-                    cell_format = self.workbook.add_format(gray_format) if row_idx % 2 == 0 else self.workbook.add_format(white_format)
-
-                worksheet.write(row_idx + 1, col_idx, cell_value, cell_format)
+        self._write_banded_body(worksheet, df, first_row, plan)
     
 
-    def apply_data_table_format(self, worksheet: Worksheet, df: pd.DataFrame, num_format: str, highlighted_categories: str | list = ""):
+    def apply_data_table_format(self, worksheet: Worksheet, df: pd.DataFrame, num_format: str, highlighted_categories: str | list = "", first_row: int = 1):
         """Applies formatting to data tables"""
 
         ### Basic configurations
-        worksheet.hide_gridlines(2)
-        fmt = self.format.cells['data_table']
-        fmt['data']['num_format'] = num_format
-
+        plan = self.compile_plan('data_table', df, num_format)
+        formats = plan.formats
         if isinstance(highlighted_categories, str):
             highlighted_categories = [highlighted_categories]
 
         ### Widths and heights
         # First column width
-        for column, width in fmt["column_widths"].items():
-            worksheet.set_column(column, width)
+        self._apply_plan_layout(worksheet, plan)
         
         # Columnas restantes (años y Var (%))
-        num_columns = df.shape[1] - 1 
-        base_width = 8.0 if num_columns <= 5 else (6.0 if num_columns <= 8 else 5.2)
-        
-        handicap = 0 if num_format == 0 else (2.3 if num_format in ('0.0', '0,0%') else 3.3)
+        base_width, handicap = plan.settings['base_width'], plan.settings['handicap']
+        metrics = text_metrics(df)
         for col_idx in range(1, df.shape[1]):
             # Longitud máxima considerando solo parte entera (evita decimales inflados)
-            max_len = df.iloc[:, col_idx].astype(str).apply(
-                lambda x: len(x.split('.')[0])
-            ).max()
+            max_len = metrics.max_integer_length(col_idx)
                 
             dynamic_width = max(base_width, min(10, max_len + handicap))
             dynamic_width = round(float(dynamic_width), 2)  # Convertir a Python float
+            if first_row > 1:  # Later chunks can only widen the columns
+                dynamic_width = max(dynamic_width, self._column_widths.get((worksheet.name, col_idx), 0))
+            self._column_widths[(worksheet.name, col_idx)] = dynamic_width
             
             # Aplicar ancho + formato numérico
             worksheet.set_column(col_idx, col_idx, dynamic_width)
 
         # Row heights
-        for row_idx in range(1, df.shape[0]+1):
-            if df.shape[0] > 10:
-                worksheet.set_row(row_idx, 18)
-            else:
-                worksheet.set_row(row_idx, 26) # consider 30
+        row_height = 18 if first_row - 1 + df.shape[0] > 10 else 26 # consider 30
+        self._set_row_heights(worksheet, first_row, df.shape[0], row_height)
 
 
         ### Writing data
-        highlighted_row = False
-        for row_idx in range(df.shape[0]):
-            cell_value = df.iloc[row_idx, 0]
-
-            # First column (e.g., dates or text)
-            if highlighted_categories and cell_value in highlighted_categories:
-                highlighted_row = True
-                fmt_modified = copy.deepcopy(fmt["first_column"])
-                fmt_modified['bg_color'] = Color.BLUE_LIGHT
-                fmt_modified['bold'] = True,
-                worksheet.write(row_idx + 1, 0, cell_value, self.workbook.add_format(fmt_modified))
-            else:
-                worksheet.write(row_idx + 1, 0, cell_value, self.workbook.add_format(fmt['first_column']))
-
-            # Rest of columns (numeric data)
-            for col_idx in range(1, df.shape[1]):
-                cell_value = df.iloc[row_idx, col_idx]
-                fmt_modified = copy.deepcopy(fmt["data"])
-                try:
-                    if int(cell_value) > 9999:
-                        fmt_modified['num_format'] = "# ### ##" + num_format
-                except ValueError:
-                    pass
-
-                if highlighted_row:
-                    fmt_modified['bg_color'] = Color.BLUE_LIGHT
-                    fmt_modified['bold'] = True
-                
-                # Skip NaN/Inf values by checking if the value is NaN or Inf
-                if pd.isna(cell_value) or (isinstance(cell_value, (int, float)) and np.isinf(cell_value)):
-                    worksheet.write(row_idx + 1, col_idx, '', self.workbook.add_format(fmt_modified))  # Write an empty cell
-                else:
-                    worksheet.write(row_idx + 1, col_idx, cell_value, self.workbook.add_format(fmt_modified))
-            highlighted_row = False
-
         # Headers
-        for col_num, col_name in enumerate(df.columns):
-            worksheet.write(0, col_num, col_name, self.workbook.add_format(fmt["header"]))
-
+        self._write_header(worksheet, df, self.format_registry.get(formats["header"]), first_row)
+
+        columns = self._column_values(df)
+        if highlighted_categories:
+            highlighted = df.iloc[:, 0].isin(highlighted_categories).to_numpy()
+        else:
+            highlighted = np.zeros(df.shape[0], dtype=bool)
+
+        if self.conditional_formatting:
+            # One format per column; highlighting and the thousands mask become conditional formats
+            body_values = [columns[0]] + [
+                ['' if is_blank else value for value, is_blank in zip(columns[col_idx], classify_numeric(df.iloc[:, col_idx]).blank.tolist())]
+                for col_idx in range(1, df.shape[1])
+            ]
+            body_formats = [self.format_registry.get(formats['first_column'])] + [self.format_registry.get(formats['data'])] * (df.shape[1] - 1)
+            self._write_body(worksheet, body_values, body_formats, first_row)
+
+            last_row, last_col = first_row + df.shape[0] - 1, df.shape[1] - 1
+            if df.shape[0] and last_col:
+                worksheet.conditional_format(first_row, 1, last_row, last_col, {
+                    'type': 'cell', 'criteria': '>=', 'value': 10000,
+                    'format': self.format_registry.get(formats['thousands'])
+                })
+            if df.shape[0] and highlighted.any():
+                categories = list(dict.fromkeys(df.iloc[:, 0][highlighted].tolist()))
+                worksheet.conditional_format(first_row, 0, last_row, last_col, {
+                    'type': 'formula',
+                    'criteria': self._category_criteria(xl_rowcol_to_cell(first_row, 0, col_abs=True), categories),
+                    'format': self.format_registry.get(formats['highlighted_row'])
+                })
+            return
+
+        # First column (e.g., dates or text)
+        first_column_formats = (
+            self.format_registry.get(formats['first_column']),
+            self.format_registry.get(formats['first_column_highlighted'])
+        )
+        body_values = [columns[0]]
+        body_formats = [[first_column_formats[is_highlighted] for is_highlighted in highlighted.tolist()]]
+
+        # Rest of columns (numeric data). Format ids: +1 thousands mask, +2 highlighted row
+        data_formats = tuple(
+            self.format_registry.get(formats[name])
+            for name in ('data', 'data_thousands', 'data_highlighted', 'data_thousands_highlighted')
+        )
+        highlight_ids = highlighted.astype(int) * 2
+        for col_idx in range(1, df.shape[1]):
+            masks = classify_numeric(df.iloc[:, col_idx])
+            format_ids = (masks.thousands.astype(int) + highlight_ids).tolist()
+            # NaN/Inf values are written as empty (but formatted) cells
+            body_values.append(['' if is_blank else value for value, is_blank in zip(columns[col_idx], masks.blank.tolist())])
+            body_formats.append([data_formats[format_id] for format_id in format_ids])
+        self._write_body(worksheet, body_values, body_formats, first_row)
 
-    def apply_index_format(self, worksheet: Worksheet, df: pd.DataFrame, num_format: str = ""):
-        ### Basic configurations
-        worksheet.hide_gridlines(2)
-        fmt = self.format.cells['index']
 
-        # Set column widths
-        for column, width in fmt["column_widths"].items():
-            worksheet.set_column(column, width)
-                #worksheet.set_column('G:G', 20)
+    def apply_index_format(self, worksheet: Worksheet, df: pd.DataFrame, num_format: str = "", first_row: int = 1):
+        ### Basic configurations, column widths
+        plan = self.compile_plan('index', df, num_format)
+        self._apply_plan_layout(worksheet, plan)
 
         ### Writing
         # Write headers with header format
-        for col_num, col_name in enumerate(df.columns):
-            worksheet.write(0, col_num, col_name, self.workbook.add_format(fmt['header']))
-
-        # Modify base formats
-        gray_format = {**fmt['first_column']}
-        gray_bold_format = {**gray_format, 'bold': True, 'align': 'left'}
-        white_format = {**fmt['data'], 'right': 0}
-        white_bold_format = {**white_format, 'bold': True, 'align': 'left'}
+        self._write_header(worksheet, df, self.format_registry.get(plan.formats['header']), first_row)
         
         # Write table contents with alternating colors and bold for first column
-        for row_idx in range(df.shape[0]):
-            for col_idx in range(df.shape[1]):
-                cell_value = df.iloc[row_idx, col_idx]
+        self._write_banded_body(worksheet, df, first_row, plan)
+    
 
-                # Select format based on column and row index
-                if col_idx == 0:
-                    cell_format = self.workbook.add_format(gray_bold_format) if row_idx % 2 == 0 else self.workbook.add_format(white_bold_format)
-                else:
-                    cell_format = self.workbook.add_format(gray_format) if row_idx % 2 == 0 else self.workbook.add_format(white_format)
+    def apply_plain_format(self, worksheet: Worksheet, df: pd.DataFrame, first_row: int = 1):
+        """Writes headers (styled like pandas' to_excel header) and values in row order without any other styling."""
+        self._write_header(worksheet, df, self.format_registry.get(PLAIN_HEADER), first_row)
+        self._write_body(worksheet, self._column_values(df), [None] * df.shape[1], first_row)
 
-                worksheet.write(row_idx + 1, col_idx, cell_value, cell_format)
-    
 
-    def apply_report_format(self, worksheet: Worksheet, df: pd.DataFrame, **kwargs):
+    def apply_report_format(self, worksheet: Worksheet, df: pd.DataFrame, first_row: int = 1, **kwargs):
         """Applies formatting only to cells with data."""
 
-        ### Basic configurations
-        fmt = self.format.cells['report']
-        fmt.update(kwargs.get("config"))
-        worksheet.hide_gridlines(2)
-
-        ### Widths and heights
-        for column, width in fmt["column_widths"].items():
-            worksheet.set_column(column, width)
+        ### Basic configurations, widths and heights
+        plan = self.compile_plan('report', df, config=kwargs.get("config"))
+        formats = plan.formats
+        self._apply_plan_layout(worksheet, plan)
         
         ### Writing data
-        for row_idx in range(df.shape[0]):
-            cell_value = df.iloc[row_idx, 0]
-
-            # First column (e.g., dates or text)
-            worksheet.write(row_idx + 1, 0, cell_value, self.workbook.add_format(fmt['first_column']))
-
-            # Rest of columns (numeric data)
-            for col_idx in range(1, df.shape[1]):
-                cell_value = df.iloc[row_idx, col_idx]
-                worksheet.write(row_idx + 1, col_idx, cell_value, self.workbook.add_format(fmt["data"]))
-
         # Headers
-        for col_num, col_name in enumerate(df.columns):
-            worksheet.write(0, col_num, col_name, self.workbook.add_format(fmt["header"]))
+        self._write_header(worksheet, df, self.format_registry.get(formats["header"]), first_row)
+
+        # First column (e.g., dates or text), rest of columns (numeric data)
+        body_formats = [self.format_registry.get(formats['first_column'])] + [self.format_registry.get(formats["data"])] * (df.shape[1] - 1)
+        self._write_body(worksheet, self._column_values(df), body_formats, first_row)
 
         # if len(df.columns) > 1:
         #     if len(str(df.columns[1])) > 11:
         #         worksheet.set_column(1, len(df.columns) - 1, 14)
         #     else:
         #         worksheet.set_column(1, len(df.columns) - 1, 10)
-
-
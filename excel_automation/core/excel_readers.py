@@ -0,0 +1,438 @@
+import posixpath
+import zipfile
+import numpy as np
+import pandas as pd
+from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Callable, Iterator, Literal
+from xml.etree import ElementTree
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+from openpyxl import load_workbook
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from openpyxl.cell.text import Text
+from openpyxl.reader.strings import read_string_table
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# Placeholder for cells that hold data but were not converted (outside a column projection)
+SKIPPED = type("Skipped", (), {"__repr__": lambda self: "SKIPPED"})()
+
+
+def rows_to_dataframe(data: list[list], names: list | None = None) -> pd.DataFrame:
+    """
+    Builds a DataFrame from raw rows (header first) exactly like `pd.read_excel` does with its default options.
+    If `names` is given, `data` has no header row and these are the column names.
+    """
+    if names is not None:
+        return TextParser(data, names=names, header=None, skip_blank_lines=False).read()
+    if not data:
+        return pd.DataFrame()
+    try:
+        return TextParser(data, header=0, skip_blank_lines=False).read()
+    except EmptyDataError:
+        return pd.DataFrame()
+
+
+def key_text(value) -> str:
+    """Text used to match header names and first-column values in projections (2015 and 2015.0 both match '2015')."""
+    if value is None or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def raw_value(value):
+    """Inverse of pandas' inference for a parsed cell: the value a reader yields for it (blanks "", integral numbers int)."""
+    if value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def header_names(header: list) -> list:
+    """Column names pandas gives to a raw header row ('Unnamed: n' for blanks, 'name.1' for duplicates)."""
+    return rows_to_dataframe([header]).columns.tolist() if header else []
+
+
+def project_dataframe(df: pd.DataFrame, columns: tuple[str, ...] | None = None, rows: tuple[str, ...] | None = None) -> pd.DataFrame:
+    """
+    Keeps the key column (the first column holding data) plus the columns whose name is in `columns`,
+    and the rows whose key value is in `rows`. Used by backends that cannot project while parsing.
+    """
+    non_empty = df.notna().any().to_numpy()
+    if (columns is None and rows is None) or not non_empty.any():
+        return df
+    key_position = int(non_empty.argmax())
+    if rows is not None:
+        selected_rows = set(rows)
+        df = df[[key_text(value) in selected_rows for value in df.iloc[:, key_position].tolist()]]
+        # Infer dtypes again from the kept rows only, as a reader filtering while parsing does
+        data = [[raw_value(value) for value in values] for values in df.to_numpy(dtype=object).tolist()]
+        df = rows_to_dataframe(data, names=df.columns.tolist())
+    if columns is not None:
+        selected_columns = set(columns)
+        df = df.iloc[:, [
+            position for position, name in enumerate(df.columns)
+            if position == key_position or key_text(name) in selected_columns
+        ]]
+    return df
+
+
+class ReaderBackend(ABC):
+    def __init__(self, file_path: str):
+        """
+        A workbook opened for reading. Backends only differ in speed: `parse` must return what
+        `pd.read_excel(file_path, sheet_name=...)` returns with the openpyxl engine, projected with `project_dataframe`.
+        """
+        self.file_path = file_path
+
+    @property
+    @abstractmethod
+    def sheet_names(self) -> list[str]:
+        ...
+
+    @abstractmethod
+    def parse(self, sheet_name: str, columns: tuple[str, ...] | None = None, rows: tuple[str, ...] | None = None) -> pd.DataFrame:
+        """
+        Parses a sheet with its first row as header.
+
+        Parameters
+        ----------
+        sheet_name : str
+            Sheet to parse
+        columns : tuple of str, optional
+            Header names to keep besides the key column (the first column holding data)
+        rows : tuple of str, optional
+            Key column values of the rows to keep
+        """
+
+    def iter_rows(self, sheet_name: str, keep_column: Callable[[int], bool] | None = None) -> Iterator[list]:
+        """
+        Streams the raw rows of a sheet from row 1 (empty lists for empty rows), with cells converted like pandas' 
+        openpyxl reader: empty cells are "", errors NaN, integral numbers int. Trailing empty cells are trimmed.
+        Cells of columns for which `keep_column(position)` is False are not converted and yield SKIPPED instead.
+
+        This default goes through openpyxl's read-only mode, so memory does not grow with the number of rows.
+        """
+        workbook = load_workbook(self.file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            if sheet_name not in workbook.sheetnames:
+                raise ValueError(f"Worksheet named '{sheet_name}' not found")
+            worksheet = workbook[sheet_name]
+            worksheet.reset_dimensions()
+            for row in worksheet.rows:
+                values = []
+                for position, cell in enumerate(row):
+                    if cell.value is None:
+                        values.append("")
+                    elif keep_column is not None and not keep_column(position):
+                        values.append(SKIPPED)
+                    elif cell.data_type == TYPE_ERROR:
+                        values.append(np.nan)
+                    elif cell.data_type == TYPE_NUMERIC and int(cell.value) == cell.value:
+                        values.append(int(cell.value))
+                    elif cell.data_type == TYPE_NUMERIC:
+                        values.append(float(cell.value))
+                    else:
+                        values.append(cell.value)
+                while values and values[-1] == "":
+                    values.pop()
+                yield values
+        finally:
+            workbook.close()
+
+    def close(self) -> None:
+        pass
+
+
+class PandasReader(ReaderBackend):
+    """Reads through `pd.ExcelFile` with one of the engines supported by pandas."""
+    engine: str = "openpyxl"
+
+    @cached_property
+    def excel_file(self) -> pd.ExcelFile:
+        return pd.ExcelFile(self.file_path, engine=self.engine)
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return self.excel_file.sheet_names
+
+    def parse(self, sheet_name: str, columns: tuple[str, ...] | None = None, rows: tuple[str, ...] | None = None) -> pd.DataFrame:
+        # Projections are applied after the full read: pandas' engines convert every cell of the sheet before 
+        # `usecols` is applied, and a row selection by key value gives no `nrows` bound. Only the iterparse 
+        # backend skips unselected cells and rows while parsing
+        return project_dataframe(self.excel_file.parse(sheet_name=sheet_name), columns, rows)
+
+    def close(self) -> None:
+        if "excel_file" in self.__dict__:
+            self.excel_file.close()
+            del self.excel_file
+
+
+class OpenpyxlReader(PandasReader):
+    engine = "openpyxl"
+
+
+class CalamineReader(PandasReader):
+    """Rust-based reader, requires the optional `python-calamine` package."""
+    engine = "calamine"
+
+    def __init__(self, file_path: str):
+        try:
+            import python_calamine  # noqa: F401
+        except ImportError as error:
+            raise ImportError("The 'calamine' reader requires python-calamine: pip install python-calamine") from error
+        super().__init__(file_path)
+
+
+class IterparseReader(ReaderBackend):
+    """
+    Streams the worksheet XML with `ElementTree.iterparse` and converts cells directly to the values pandas
+    gets from openpyxl (same shared strings, date styles and number casting), without building openpyxl
+    Cell objects. Pure Python, no extra dependencies.
+    """
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._archive = zipfile.ZipFile(file_path)
+        self._workbook_path = self._office_document_path()
+        self._relationships = self._read_relationships(self._workbook_path)
+
+        workbook = ElementTree.fromstring(self._archive.read(self._workbook_path))
+        properties = workbook.find(f"{{{SHEET_MAIN_NS}}}workbookPr")
+        date1904 = properties is not None and properties.get("date1904") in ("1", "true")
+        self._epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        # Only worksheets (not chartsheets), in workbook order, like openpyxl's `worksheets`
+        self._sheet_paths: dict[str, str] = {}
+        for sheet in workbook.iter(f"{{{SHEET_MAIN_NS}}}sheet"):
+            rel_type, target = self._relationships.get(sheet.get(f"{{{OFFICE_REL_NS}}}id"), ("", ""))
+            if rel_type.endswith("/worksheet"):
+                self._sheet_paths[sheet.get("name")] = target
+
+    def _office_document_path(self) -> str:
+        try:
+            root = ElementTree.fromstring(self._archive.read("_rels/.rels"))
+        except KeyError:
+            return "xl/workbook.xml"
+        for relationship in root.iter(f"{{{REL_NS}}}Relationship"):
+            if relationship.get("Type", "").endswith("/officeDocument"):
+                return relationship.get("Target").lstrip("/")
+        return "xl/workbook.xml"
+
+    def _read_relationships(self, part: str) -> dict[str, tuple[str, str]]:
+        """Relationship id -> (type, absolute part name) of a package part."""
+        folder, name = posixpath.split(part)
+        try:
+            root = ElementTree.fromstring(self._archive.read(posixpath.join(folder, "_rels", f"{name}.rels")))
+        except KeyError:
+            return {}
+        relationships = {}
+        for relationship in root.iter(f"{{{REL_NS}}}Relationship"):
+            target = relationship.get("Target", "")
+            target = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join(folder, target))
+            relationships[relationship.get("Id")] = (relationship.get("Type", ""), target)
+        return relationships
+
+    def _related_part(self, suffix: str, default: str) -> str:
+        for rel_type, target in self._relationships.values():
+            if rel_type.endswith(suffix):
+                return target
+        return default
+
+    @cached_property
+    def _shared_strings(self) -> list[str]:
+        try:
+            with self._archive.open(self._related_part("/sharedStrings", "xl/sharedStrings.xml")) as source:
+                return read_string_table(source)
+        except KeyError:
+            return []
+
+    @cached_property
+    def _date_styles(self) -> tuple[frozenset, frozenset]:
+        """Style ids (cellXfs indexes) formatted as dates and as timedeltas."""
+        try:
+            styles_path = self._related_part("/styles", "xl/styles.xml")
+            stylesheet = Stylesheet.from_tree(ElementTree.fromstring(self._archive.read(styles_path)))
+        except KeyError:
+            return frozenset(), frozenset()
+        return frozenset(stylesheet.date_formats), frozenset(stylesheet.timedelta_formats)
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return list(self._sheet_paths)
+
+    def iter_rows(self, sheet_name: str, keep_column: Callable[[int], bool] | None = None) -> Iterator[list]:
+        """
+        Yields every row from row 1 (empty lists for empty rows) with cells from column A, converted like
+        pandas' openpyxl reader: empty cells are "", errors NaN, integral numbers int. Trailing empty cells are trimmed.
+        Cells of columns for which `keep_column(position)` is False are not converted and yield SKIPPED instead.
+        """
+        if sheet_name not in self._sheet_paths:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+        shared_strings = self._shared_strings
+        date_styles, timedelta_styles = self._date_styles
+        epoch = self._epoch
+        sheet_data_tag, row_tag, cell_tag = f"{{{SHEET_MAIN_NS}}}sheetData", f"{{{SHEET_MAIN_NS}}}row", f"{{{SHEET_MAIN_NS}}}c"
+        value_tag, inline_tag = f"{{{SHEET_MAIN_NS}}}v", f"{{{SHEET_MAIN_NS}}}is"
+        column_indexes: dict[str, int] = {}
+
+        row_counter = 0
+        sheet_data = None
+        with self._archive.open(self._sheet_paths[sheet_name]) as source:
+            for event, element in ElementTree.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if element.tag == sheet_data_tag:
+                        sheet_data = element
+                    continue
+                if element.tag != row_tag:
+                    continue
+                row_number = int(element.get("r") or row_counter + 1)
+                while row_counter + 1 < row_number:  # Missing rows are empty
+                    row_counter += 1
+                    yield []
+                row_counter = row_number
+
+                values: list = []
+                column = -1
+                for cell in element.iter(cell_tag):
+                    reference = cell.get("r")
+                    if reference:
+                        letters = reference.rstrip("0123456789")
+                        column = column_indexes.get(letters)
+                        if column is None:
+                            column = column_indexes[letters] = column_index_from_string(letters) - 1
+                    else:  # Cells without reference follow the previous one
+                        column += 1
+
+                    data_type = cell.get("t", "n")
+                    if keep_column is not None and not keep_column(column):
+                        present = cell.find(inline_tag) is not None if data_type == "inlineStr" else bool(cell.findtext(value_tag))
+                        value = SKIPPED if present else None
+                    elif data_type == "inlineStr":
+                        child = cell.find(inline_tag)
+                        value = Text.from_tree(child).content if child is not None else None
+                    else:
+                        value = cell.findtext(value_tag) or None
+                        if value is not None:
+                            if data_type == "n":
+                                value = float(value) if ("." in value or "E" in value or "e" in value) else int(value)
+                                style_id = int(cell.get("s") or 0)
+                                if style_id in date_styles:
+                                    try:
+                                        value = from_excel(value, epoch, timedelta=style_id in timedelta_styles)
+                                    except (OverflowError, ValueError):
+                                        value = np.nan  # Out of range dates are error cells in openpyxl
+                                elif value == int(value):
+                                    value = int(value)
+                            elif data_type == "s":
+                                value = shared_strings[int(value)]
+                            elif data_type == "b":
+                                value = bool(int(value))
+                            elif data_type == "e":
+                                value = np.nan
+                            elif data_type == "d":
+                                value = from_ISO8601(value)
+
+                    if value is None:
+                        continue
+                    if column > len(values):
+                        values.extend([""] * (column - len(values)))
+                    if column == len(values):
+                        values.append(value)
+                    else:
+                        values[column] = value
+
+                while values and values[-1] == "":
+                    values.pop()
+                # Processed rows are detached from <sheetData>, so memory stays bounded by one row
+                if sheet_data is not None:
+                    sheet_data.remove(element)
+                else:
+                    element.clear()
+                yield values
+
+    def parse(self, sheet_name: str, columns: tuple[str, ...] | None = None, rows: tuple[str, ...] | None = None) -> pd.DataFrame:
+        # With a column projection, only the header row, the key column and the selected columns are converted.
+        # With a row selection, rows that cannot be selected are dropped while streaming instead of being kept until
+        # the end. The key column is the leftmost one holding data, so it is discovered while streaming
+        key_position = float("inf")
+        selected_positions: set[int] = set()
+        header_length = 0
+        header_row = True
+
+        def keep_column(position: int) -> bool:
+            return header_row or position <= key_position or position in selected_positions or (
+                position >= header_length and f"Unnamed: {position}" in selected_columns  # Columns without header cell
+            )
+
+        def may_be_selected(values: list) -> bool:
+            # The final key column is at most the current one, so the key value is one of the first cells
+            # (or a blank, for rows shorter than the key position)
+            candidates = values[:key_position + 1]
+            return any(key_text(value) in selected_rows for value in candidates) or (
+                len(values) <= key_position and "" in selected_rows
+            )
+
+        selected_columns = set(columns or ())
+        selected_rows = set(rows or ())
+        data = []
+        last_row_with_data = -1
+        max_width = 0  # Over every row, dropped ones included: it sets the columns of the frame
+        for values in self.iter_rows(sheet_name, keep_column if columns is not None else None):
+            if header_row:
+                header_row = False
+                header_length = max_width = len(values)
+                if columns is not None:
+                    selected_positions = {position for position, name in enumerate(header_names(values)) if key_text(name) in selected_columns}
+            elif values:
+                max_width = max(max_width, len(values))
+                first_position = next((position for position, value in enumerate(values) if value != "" and not pd.isna(value)), None)
+                if first_position is not None:
+                    key_position = min(key_position, first_position)
+                if rows is not None and key_position != float("inf") and not may_be_selected(values):
+                    continue
+            if values:
+                last_row_with_data = len(data)
+            data.append(values)
+        data = data[:last_row_with_data + 1]
+        if not data:
+            return pd.DataFrame()
+
+        data = [values + [""] * (max_width - len(values)) for values in data]
+        if key_position == float("inf") or (columns is None and rows is None):
+            return rows_to_dataframe(data)
+
+        if rows is not None:
+            data = data[:1] + [values for values in data[1:] if key_text(values[key_position]) in selected_rows]
+        if columns is None:
+            return rows_to_dataframe(data)
+        names = header_names(data[0])
+        usecols = sorted({position for position, name in enumerate(names) if key_text(name) in selected_columns} | {key_position})
+        data = [[values[position] for position in usecols] for values in data[1:]]
+        return rows_to_dataframe(data, names=[names[position] for position in usecols])
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+READERS: dict[str, type[ReaderBackend]] = {
+    "openpyxl": OpenpyxlReader,
+    "calamine": CalamineReader,
+    "iterparse": IterparseReader,
+}
+
+
+def open_reader(file_path: str, reader: Literal["openpyxl", "calamine", "iterparse"] = "openpyxl") -> ReaderBackend:
+    """Opens `file_path` with the reader backend registered under `reader`."""
+    if reader not in READERS:
+        raise ValueError(f"Unknown reader '{reader}'. Available readers: {list(READERS)}")
+    return READERS[reader](file_path)
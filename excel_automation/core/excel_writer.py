@@ -3,12 +3,22 @@ import pandas as pd
 from xlsxwriter.workbook import Workbook
 from xlsxwriter.worksheet import Worksheet
 from .excel_formatter import ExcelFormatter
-from ..utils import Formats
-from typing import Tuple, Literal
+from ..utils import Formats, FormatRegistry
+from typing import Callable, Iterable, Iterator, Tuple, Literal
 
+# Templates that write the cell values as they are, so blanks must already be "".
+# "database" and "data_table" blank NaN/Inf in their numeric columns themselves, and to_excel writes NaN as an empty cell
+RAW_VALUE_TEMPLATES = {"text_table", "index", "report"}
 
 class ExcelWriterXL:
-    def __init__(self, df_list: list[pd.DataFrame], output_name: str, output_folder: str):
+    def __init__(
+        self, 
+        df_list: list[pd.DataFrame], 
+        output_name: str, 
+        output_folder: str, 
+        constant_memory: bool = False, 
+        conditional_formatting: bool = False
+    ):
         """
         A class for writing multiple pandas DataFrames to Excel files with customized formatting.
         Uses xlsxwriter as the underlying engine and works with the ExcelFormatter class for styling.
@@ -21,11 +31,20 @@ class ExcelWriterXL:
             Name for the output file (extension already provided)
         output_folder : str:
             Folder path to save the file in.
+        constant_memory : bool, optional
+            Opt-in streaming mode (xlsxwriter's constant_memory). Each row is flushed to disk as soon as
+            a later row is written, so peak memory stays flat regardless of sheet size. Cells must then be
+            written in row order: a sheet cannot be modified after it has been written.
+        conditional_formatting : bool, optional
+            Express row banding, highlighted rows and the thousands mask through worksheet-level conditional 
+            formats instead of per-cell formats (see ExcelFormatter).
             
         Attributes
         ----------
         writer : pd.ExcelWriter
             ExcelWriter object with xlsxwriter engine
+        format_registry : FormatRegistry
+            Workbook-scoped cache of Format objects, shared with the formatter and the charts
         formatter : ExcelFormatter
             Formatter object that handles the styling of the Excel worksheets
         format : Formats
@@ -35,10 +54,12 @@ class ExcelWriterXL:
         """
         self.output_path = Path(output_folder) / f"{output_name}.xlsx"
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        self.writer = pd.ExcelWriter(self.output_path, engine='xlsxwriter')
-        self.formatter = ExcelFormatter(df_list, self.writer)
-        self.format = Formats()
+        self.constant_memory = constant_memory
+        self.writer = pd.ExcelWriter(self.output_path, engine='xlsxwriter', engine_kwargs={'options': {'constant_memory': constant_memory}})
         self.workbook: Workbook = self.writer.book
+        self.format_registry = FormatRegistry(self.workbook)
+        self.formatter = ExcelFormatter(df_list, self.writer, self.format_registry, conditional_formatting)
+        self.format = Formats()
         self.sheet_list = []
         self.df_list = df_list
     
@@ -53,7 +74,7 @@ class ExcelWriterXL:
 
     def write_from_df(
         self, 
-        df: pd.DataFrame, 
+        df: pd.DataFrame | Iterable[pd.DataFrame] | Callable[[], Iterable[pd.DataFrame]], 
         sheet_name: str, 
         num_format: str, 
         format_template: Literal["database", "index", "data_table", "text_table", "report"] | None = "database",
@@ -65,8 +86,9 @@ class ExcelWriterXL:
         
         Parameters
         ----------
-        df : pd.DataFrame
-            The DataFrame to write to the Excel worksheet
+        df : pd.DataFrame, iterable of pd.DataFrame or callable returning one
+            The DataFrame to write to the Excel worksheet. Chunks (with the same columns) are written
+            as they arrive, one below the other, so the full table is never held in memory.
         sheet_name : str
             Name of the worksheet to write to
         num_format : str
@@ -86,33 +108,98 @@ class ExcelWriterXL:
         Returns
         -------
         Tuple[pd.DataFrame, Worksheet]
-            A tuple containing the written DataFrame and the xlsxwriter Worksheet object
+            A tuple containing the written DataFrame (for chunked input, only the first chunk) 
+            and the xlsxwriter Worksheet object
         """
         worksheet = self._ensure_worksheet_exists(sheet_name)
-        df = df.infer_objects(copy=False).fillna("")
+        if isinstance(df, pd.DataFrame):
+            df = self._fill_blanks(df, format_template)
+            self._apply_template(worksheet, df, sheet_name, num_format, format_template, highlighted_categories, 1, **kwargs)
+            return df, worksheet
+
+        # Chunked input: track the row offset while chunks arrive
+        first_chunk = None
+        first_row = 1
+        chunks = df() if callable(df) else df
+        for chunk in self._merge_leading_chunks(chunks):
+            if not isinstance(chunk, pd.DataFrame):
+                raise TypeError(f"Chunks must be DataFrames, got {type(chunk).__name__}")
+            chunk = self._fill_blanks(chunk, format_template)
+            self._apply_template(worksheet, chunk, sheet_name, num_format, format_template, highlighted_categories, first_row, **kwargs)
+            first_row += chunk.shape[0]
+            if first_chunk is None:
+                first_chunk = chunk
 
+        return (first_chunk if first_chunk is not None else pd.DataFrame()), worksheet
+
+    def _fill_blanks(self, df: pd.DataFrame, format_template: str | None) -> pd.DataFrame:
+        """
+        Turns missing values into "" only where the template writes them as they are. Numeric columns of the
+        "database" and "data_table" templates stay numeric (only their first column, written raw, is filled).
+        """
+        df = df.infer_objects(copy=False)
+        if format_template in RAW_VALUE_TEMPLATES or (format_template is None and self.constant_memory):
+            return df.fillna("")
+        if format_template in ("database", "data_table") and df.shape[1] and df.iloc[:, 0].isna().any():
+            df = df.copy(deep=False)
+            df.isetitem(0, df.iloc[:, 0].fillna(""))
+        return df
+
+    @staticmethod
+    def _merge_leading_chunks(chunks: Iterable[pd.DataFrame], min_rows: int = 11) -> Iterator[pd.DataFrame]:
+        """
+        Yields the chunks, merging the leading ones until they add up to `min_rows`. 
+        Templates that depend on the table length (e.g. data_table row heights for more than 10 rows) 
+        can then decide from the first chunk alone.
+        """
+        chunks = iter(chunks)
+        leading, n_rows = [], 0
+        for chunk in chunks:
+            leading.append(chunk)
+            n_rows += len(chunk)
+            if n_rows >= min_rows:
+                break
+        if leading:
+            yield leading[0] if len(leading) == 1 else pd.concat(leading, ignore_index=True)
+        yield from chunks
+
+    def _apply_template(
+        self,
+        worksheet: Worksheet,
+        df: pd.DataFrame,
+        sheet_name: str,
+        num_format: str,
+        format_template: str | None,
+        highlighted_categories: str | list,
+        first_row: int,
+        **kwargs
+    ) -> None:
+        """Dispatches a (chunk of a) DataFrame to the formatter template, starting at `first_row`."""
         if format_template == "database":
-            self.formatter.apply_database_format(worksheet, df, num_format)
+            self.formatter.apply_database_format(worksheet, df, num_format, first_row)
         elif format_template == "data_table":
-            self.formatter.apply_data_table_format(worksheet, df, num_format, highlighted_categories)
+            self.formatter.apply_data_table_format(worksheet, df, num_format, highlighted_categories, first_row)
         elif format_template == "text_table":
-            self.formatter.apply_text_table_format(worksheet, df, num_format)    
+            self.formatter.apply_text_table_format(worksheet, df, num_format, first_row)    
         elif format_template == "index":
-            self.formatter.apply_index_format(worksheet, df, num_format)
+            self.formatter.apply_index_format(worksheet, df, num_format, first_row)
         elif format_template == "report":
-            self.formatter.apply_report_format(worksheet, df, **kwargs) 
+            self.formatter.apply_report_format(worksheet, df, first_row, **kwargs) 
+        elif self.constant_memory:
+            # pandas writes cells column by column, which constant_memory mode would silently drop
+            self.formatter.apply_plain_format(worksheet, df, first_row)
         else:
-            df.to_excel(self.writer, sheet_name=sheet_name, index=False)
-        
-        return df, worksheet
+            header = first_row == 1
+            df.to_excel(self.writer, sheet_name=sheet_name, index=False, header=header, startrow=0 if header else first_row)
     
 
     def write_to_excel(self, sheet_name: str, row_num: int, column_num: int, value: str, header: bool = False) -> Worksheet:
+        """Writes a single string cell. In constant_memory mode, `row_num` must not precede rows already written to the sheet."""
         worksheet = self._ensure_worksheet_exists(sheet_name)
         if header:
-            worksheet.write_string(row_num, column_num, value, cell_format=self.format.cells["report"]["header"])
+            worksheet.write_string(row_num, column_num, value, cell_format=self.format_registry.get(self.format.cells["report"]["header"]))
         else:
-            worksheet.write_string(row_num, column_num, value, cell_format=self.format.cells["report"]["data"])
+            worksheet.write_string(row_num, column_num, value, cell_format=self.format_registry.get(self.format.cells["report"]["data"]))
 
         return worksheet
 
@@ -0,0 +1,113 @@
+import os
+import time
+import traceback
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+from .excel_data_extractor import ExcelDataExtractor
+
+
+@dataclass
+class WorkbookLoad:
+    """Result of loading one workbook: its cleaned sheets by name, the time it took and the error, if any."""
+    file_path: str
+    sheets: dict[str, pd.DataFrame] = field(default_factory=dict)
+    seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _workbook_files(source: str | Path | Iterable[str | Path]) -> list[str]:
+    """Expands a folder into its .xlsx files (sorted, skipping Excel's '~$' lock files); lists are kept as given."""
+    if isinstance(source, (str, Path)) and os.path.isdir(source):
+        return sorted(
+            os.path.join(source, name) for name in os.listdir(source)
+            if name.endswith(".xlsx") and not name.startswith("~$")
+        )
+    if isinstance(source, (str, Path)):
+        return [os.fspath(source)]
+    return [os.fspath(path) for path in source]
+
+
+def _failed_load(file_path: str, error: Exception, seconds: float = 0.0) -> WorkbookLoad:
+    return WorkbookLoad(file_path, seconds=seconds, error=f"{type(error).__name__}: {error}\n{traceback.format_exc()}")
+
+
+def _load_workbook(file_path: str, include_first: bool, read_options: dict, extractor_options: dict) -> WorkbookLoad:
+    # Runs in a worker process: every failure is captured so one bad file does not abort the batch
+    start = time.perf_counter()
+    folder, file_name = os.path.split(file_path)
+    try:
+        with ExcelDataExtractor(file_name.removesuffix(".xlsx"), folder, **extractor_options) as extractor:
+            sheet_names = extractor.sheet_names if include_first else extractor.sheet_names[1:]
+            dfs = extractor.worksheets_to_dataframes(include_first, lazy=False, **read_options)
+        return WorkbookLoad(file_path, dict(zip(sheet_names, dfs)), time.perf_counter() - start)
+    except Exception as e:
+        return _failed_load(file_path, e, time.perf_counter() - start)
+
+
+def load_workbooks(
+    source: str | Path | Iterable[str | Path],
+    include_first: bool = True,
+    max_workers: int | None = None,
+    columns: list[str] | str | None = None,
+    rows: list[str] | str | None = None,
+    **extractor_options
+) -> dict[str, WorkbookLoad]:
+    """
+    Loads several workbooks in parallel, one worker process per file, and returns their cleaned sheets.
+
+    Parsing is CPU-bound and holds the GIL, so the files are spread over a process pool: the cold load of a folder
+    takes about as long as its slowest workbook instead of the sum of all of them. The largest files are submitted
+    first so they do not end up alone at the tail of the batch.
+
+    Parameters
+    ----------
+    source : str, Path or iterable of them
+        A folder (every .xlsx file in it is loaded) or the paths of the workbooks.
+    include_first : bool, optional
+        Whether to include the first worksheet of every workbook. Defaults to True.
+    max_workers : int, optional
+        Size of the process pool. Defaults to the number of CPUs (capped at the number of files).
+        With 1, the files are loaded sequentially in the current process.
+    columns, rows : list[str] or str, optional
+        Column and row selections applied to every sheet while reading (see `ExcelDataExtractor.worksheet_to_dataframe`).
+    **extractor_options
+        Forwarded to every `ExcelDataExtractor` (e.g. `reader`, `cache_dir`, `legacy_preprocessing`).
+
+    Returns
+    -------
+    dict[str, WorkbookLoad]
+        One entry per distinct file, in input order, with `sheets` (sheet name -> DataFrame), `seconds` and `error`.
+        Failed files have no sheets and keep the exception message and traceback in `error`, including failures
+        of the pool itself (e.g. a worker process that died or options that cannot be pickled).
+
+    Notes
+    -----
+    On Windows, worker processes re-import the calling script, so call this function under
+    `if __name__ == "__main__":`.
+    """
+    files = list(dict.fromkeys(_workbook_files(source)))  # Each file is loaded once
+    read_options = ExcelDataExtractor._projection(columns, rows)
+    max_workers = min(max_workers or os.cpu_count() or 1, len(files) or 1)
+
+    if max_workers == 1:
+        results = [_load_workbook(path, include_first, read_options, extractor_options) for path in files]
+        return {result.file_path: result for result in results}
+
+    by_size = sorted(files, key=lambda path: os.path.getsize(path) if os.path.exists(path) else 0, reverse=True)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {path: executor.submit(_load_workbook, path, include_first, read_options, extractor_options) for path in by_size}
+        results = {}
+        for path in files:
+            # Failures outside the worker (e.g. a crashed process or unpicklable options) are recorded per file too
+            try:
+                results[path] = futures[path].result()
+            except Exception as e:
+                results[path] = _failed_load(path, e)
+        return results
@@ -1,2 +1,8 @@
 from .colors import Color
-from .formats import Formats
\ No newline at end of file
+from .formats import Formats, FrozenDict, overlay, thaw
+from .format_registry import FormatRegistry
+from .numeric_masks import NumericMasks, classify_numeric
+from .text_metrics import TextMetrics, text_metrics
+from .sheet_cache import SheetCache, MemorySheetCache, shared_sheet_cache
+from .lazy_sheets import LazySheets
+from .row_index import RowIndex
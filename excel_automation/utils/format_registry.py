@@ -0,0 +1,63 @@
+from enum import Enum
+from typing import Any
+from xlsxwriter.workbook import Workbook
+from xlsxwriter.format import Format
+
+
+class FormatRegistry:
+    def __init__(self, workbook: Workbook):
+        """
+        Workbook-scoped registry that interns xlsxwriter Format objects.
+        Identical property sets always return the same Format, so each distinct style is
+        registered only once per workbook no matter how many cells use it.
+
+        Parameters
+        ----------
+        workbook : Workbook
+            The xlsxwriter Workbook that owns the formats
+
+        Attributes
+        ----------
+        workbook : Workbook
+            The workbook where new formats are registered
+        """
+        self.workbook = workbook
+        self._formats: dict[tuple, Format] = {}
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        """Converts a (possibly nested) format property value into a hashable equivalent."""
+        if isinstance(value, dict):
+            return tuple(sorted((key, FormatRegistry._freeze(val)) for key, val in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(FormatRegistry._freeze(val) for val in value)
+        if isinstance(value, Enum):
+            return value.value
+        return value
+
+    def get(self, properties: dict | None = None, **overrides) -> Format:
+        """
+        Returns the Format for `properties` (plus `overrides`), creating it only the first time.
+
+        Parameters
+        ----------
+        properties : dict, optional
+            Format properties as accepted by `Workbook.add_format`
+        **overrides
+            Extra properties that take precedence over `properties`
+
+        Returns
+        -------
+        Format
+            The interned Format object for this property set
+        """
+        props = {**(properties or {}), **overrides}
+        key = self._freeze(props)
+        cell_format = self._formats.get(key)
+        if cell_format is None:
+            cell_format = self.workbook.add_format(props)
+            self._formats[key] = cell_format
+        return cell_format
+
+    def __len__(self) -> int:
+        return len(self._formats)
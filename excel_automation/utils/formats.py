@@ -1,8 +1,9 @@
 from .colors import Color
-from typing import Any, Literal
+from typing import Any, Callable, Literal, Mapping
 from functools import cached_property
 from dataclasses import dataclass
 from enum import StrEnum
+from threading import Lock
 
 class Alignment(StrEnum):
     left = 'left'
@@ -24,17 +25,114 @@ class CellConfig:
     border_color: str
     text_wrap: bool = False
 
+class FrozenDict(dict):
+    """
+    Read-only dict used for the shared format templates. It is still a `dict` (so xlsxwriter and `{**mapping}` accept it),
+    but in-place changes raise TypeError. `copy()` and `copy.deepcopy` return ordinary mutable dicts.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Shared format templates are read-only, use overlay() to derive a modified copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """
+    Read-only list used inside the shared format templates. It is still a `list`, as xlsxwriter checks options such as
+    the legend's `delete_series` or custom error bar values with `isinstance(value, list)` and ignores tuples.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Shared format templates are read-only, use thaw() to get a mutable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively converts dicts to FrozenDict and lists to FrozenList (tuples stay tuples)."""
+    if isinstance(value, Mapping):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively converts mappings back to mutable dicts and frozen lists to lists (tuples stay tuples)."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(item) for item in value)
+    return value
+
+
+def overlay(base: Mapping, changes: Mapping) -> dict:
+    """
+    Copy-on-write merge: returns a new dict with `changes` applied over `base`. Nested mappings present in both
+    are merged recursively; every other branch of `base` is shared, not copied.
+    """
+    merged = dict(base)
+    for key, value in changes.items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
+            merged[key] = overlay(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+_shared_lock = Lock()
+_shared_formats: dict[str, FrozenDict] = {}
+
+
+def _shared(name: str, build: Callable[[], dict]) -> FrozenDict:
+    """Builds and freezes a format family on first use; afterwards the same read-only mapping is shared process-wide."""
+    formats = _shared_formats.get(name)
+    if formats is None:
+        with _shared_lock:
+            formats = _shared_formats.get(name)
+            if formats is None:
+                formats = _shared_formats[name] = freeze(build())
+    return formats
+
+
 @dataclass
 class Formats():
-    @cached_property
+    """
+    Entry point to the format templates. Instances are cheap views over a process-wide registry, which is built once
+    and frozen, so templates can be shared across workbooks and threads. Use `overlay()` to derive modified versions.
+    """
+    @property
     def numeric_types(self) -> dict[Literal['date', 'integer', 'decimal_1', 'decimal_2', 'percentage'], str]:
-        return NumericTypes().numeric_types
+        return _shared('numeric_types', lambda: NumericTypes().numeric_types)
 
-    @cached_property
+    @property
     def cells(self) -> dict[Literal['database', 'index', 'data_table', 'text_table', 'report'], dict[Literal['header', 'first_column', 'data', 'column_widths'], CellConfig]]:
-        return CellFormats().cells
+        return _shared('cells', lambda: CellFormats().cells)
 
-    @cached_property
+    @property
     def charts(self) -> dict[
         Literal[
             'basic', 'line', 'line_simple', 'line_single', 'line_monthly', 'column', 'column_simple', 'column_single', 'column_stacked', 
@@ -43,7 +141,7 @@ class Formats():
         ], 
         Any
     ]:
-        return ChartFormats().charts
+        return _shared('charts', lambda: ChartFormats().charts)
 
 
 class NumericTypes:
@@ -0,0 +1,79 @@
+import pandas as pd
+from collections.abc import MutableSequence
+from typing import Callable, Iterable
+
+
+class _PendingSheet:
+    """A sheet that is parsed on first access and memoized (shared by the copies of a LazySheets)."""
+    __slots__ = ("name", "_load", "_frame")
+
+    def __init__(self, name: str, load: Callable[[str], pd.DataFrame]):
+        self.name = name
+        self._load = load
+        self._frame: pd.DataFrame | None = None
+
+    def resolve(self) -> pd.DataFrame:
+        if self._frame is None:
+            self._frame = self._load(self.name)
+        return self._frame
+
+
+class LazySheets(MutableSequence):
+    def __init__(self, sheet_names: Iterable[str], load: Callable[[str], pd.DataFrame]):
+        """
+        List-like sequence of worksheets that parses each sheet only when it is accessed, then keeps it.
+
+        Behaves like the list of DataFrames it replaces: integer indexing returns a DataFrame, slicing returns a
+        list with only the sliced sheets parsed, and items can be assigned, inserted or deleted. `copy()` is shallow
+        and shares the parsed sheets, like `list.copy()`.
+
+        Parameters
+        ----------
+        sheet_names : iterable of str
+            Names of the sheets, in order
+        load : callable
+            Returns the DataFrame of a sheet given its name
+        """
+        self._items: list[_PendingSheet | pd.DataFrame] = [_PendingSheet(name, load) for name in sheet_names]
+
+    @staticmethod
+    def _resolve(item: "_PendingSheet | pd.DataFrame") -> pd.DataFrame:
+        return item.resolve() if isinstance(item, _PendingSheet) else item
+
+    def __getitem__(self, index: int | slice) -> pd.DataFrame | list[pd.DataFrame]:
+        if isinstance(index, slice):
+            return [self._resolve(item) for item in self._items[index]]
+        return self._resolve(self._items[index])
+
+    def __setitem__(self, index: int | slice, value) -> None:
+        self._items[index] = list(value) if isinstance(index, slice) else value
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, index: int, value: pd.DataFrame) -> None:
+        self._items.insert(index, value)
+
+    def copy(self) -> "LazySheets":
+        duplicate = LazySheets((), None)
+        duplicate._items = self._items.copy()
+        return duplicate
+
+    def __reduce__(self):
+        # Pickles (e.g. across processes) as the plain list of parsed sheets
+        return (list, (self[:],))
+
+    @property
+    def loaded(self) -> list[bool]:
+        """Whether each position already holds a DataFrame (parsed or assigned)."""
+        return [not isinstance(item, _PendingSheet) or item._frame is not None for item in self._items]
+
+    def __repr__(self) -> str:
+        items = [
+            f"<sheet '{item.name}'{'' if item._frame is not None else ', not loaded'}>" if isinstance(item, _PendingSheet) else "<DataFrame>"
+            for item in self._items
+        ]
+        return f"LazySheets([{', '.join(items)}])"
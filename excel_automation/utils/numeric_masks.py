@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+THOUSANDS_THRESHOLD = 9999
+
+
+@dataclass(frozen=True)
+class NumericMasks:
+    """Boolean masks describing a column of values, aligned with its rows."""
+    thousands: np.ndarray
+    nan: np.ndarray
+    inf: np.ndarray
+
+    @property
+    def blank(self) -> np.ndarray:
+        """Cells that must be written as empty cells (NaN or Inf)."""
+        return self.nan | self.inf
+
+
+def classify_numeric(values: pd.Series | np.ndarray | list) -> NumericMasks:
+    """
+    Classifies a column of values in a single vectorized pass.
+
+    Parameters
+    ----------
+    values : pd.Series, np.ndarray or list
+        Column values. Text that does not look like a number is never masked.
+
+    Returns
+    -------
+    NumericMasks
+        `thousands`: integer part above 9999, i.e. the value needs the "# ### ##" mask.
+        `nan`: missing values (NaN, None, NaT).
+        `inf`: positive or negative infinity.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    nan = series.isna().to_numpy()
+
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        numeric = series.to_numpy(dtype=float, na_value=np.nan)
+    elif series.dtype == object:
+        numeric = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    else:  # Dates, categories, etc.
+        numeric = np.full(len(series), np.nan)
+
+    inf = np.isinf(numeric)
+    with np.errstate(invalid='ignore'):
+        thousands = np.trunc(numeric) > THOUSANDS_THRESHOLD
+    thousands &= ~inf
+    return NumericMasks(thousands=thousands, nan=nan, inf=inf)
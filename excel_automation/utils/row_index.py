@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+from typing import Iterable
+
+
+class RowIndex:
+    def __init__(self, df: pd.DataFrame):
+        """
+        Hash index of a DataFrame's first column (the categories), built once and reused for row lookups.
+
+        Maps every first-column value to the positions of its rows, so selecting, ordering or validating k
+        categories costs O(k) instead of a scan of the whole frame per call. Pass it to
+        `ExcelDataExtractor.filter_data(..., key="row")` in place of the DataFrame when the same frame is filtered
+        repeatedly (e.g. once per department).
+
+        The index reflects the frame when it was built: rebuild it after modifying the first column.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Frame to index by its first column
+        """
+        self.frame = df
+        first_column = df.iloc[:, 0]
+        self._positions: dict = first_column.groupby(first_column.to_numpy(), sort=False).indices if len(df) else {}
+
+    def __contains__(self, category) -> bool:
+        return category in self._positions
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def categories(self) -> list:
+        """Distinct first-column values (blanks, i.e. NaN and "", excluded), in order of first appearance."""
+        categories = [category for category in self._positions if not (isinstance(category, str) and category == "")]
+        return sorted(categories, key=lambda category: self._positions[category][0])
+
+    def missing(self, categories: Iterable) -> list:
+        """Categories that are not in the first column, in the given order."""
+        return [category for category in categories if category not in self._positions]
+
+    def positions(self, categories: Iterable) -> np.ndarray:
+        """Row positions of `categories`, grouped in the given order (rows of a category keep the frame order)."""
+        found = [self._positions[category] for category in categories if category in self._positions]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+    def take(self, categories: Iterable) -> pd.DataFrame:
+        """Rows of `categories` in the given order, with a fresh RangeIndex."""
+        return self.frame.iloc[self.positions(categories)].reset_index(drop=True)
+
+    def drop(self, categories: Iterable) -> pd.DataFrame:
+        """Rows of every other category, in frame order (the original index is kept)."""
+        keep = np.ones(len(self.frame), dtype=bool)
+        keep[self.positions(categories)] = False
+        return self.frame[keep]
@@ -0,0 +1,193 @@
+import os
+import sys
+import pickle
+import hashlib
+import pandas as pd
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+# Bump when the cached payload changes shape, so stale entries are never reused
+CACHE_VERSION = 1
+
+
+class SheetCache:
+    def __init__(self, directory: str | Path, max_bytes: int = 512 * 1024**2):
+        """
+        On-disk cache of parsed (and preprocessed) worksheets.
+
+        Entries are keyed by the source file fingerprint (path, size, mtime and content hash), the sheet and the
+        read options, so editing a workbook invalidates its entries automatically. Payloads are pickled; once the
+        directory grows beyond `max_bytes`, the least recently used entries are evicted.
+
+        Parameters
+        ----------
+        directory : str or Path
+            Cache folder, created if it does not exist. It can be shared by several extractors and processes.
+        max_bytes : int, optional
+            Size budget of the folder. Defaults to 512 MB.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._hashes: dict[tuple, str] = {}
+        self._total_bytes: int | None = None  # Running size of the folder, scanned on the first store
+
+    def fingerprint(self, file_path: str | Path) -> tuple:
+        """(path, size, mtime, content hash) of a file. The hash is computed once per size and mtime."""
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        signature = (path, stat.st_size, stat.st_mtime_ns)
+        if signature not in self._hashes:
+            with open(path, 'rb') as file:
+                self._hashes[signature] = hashlib.file_digest(file, 'blake2b').hexdigest()
+        return signature + (self._hashes[signature],)
+
+    def key(self, file_path: str | Path, sheet_name: str, **options) -> str:
+        """Cache key of a sheet of `file_path` read with `options`."""
+        parts = (CACHE_VERSION, pd.__version__, self.fingerprint(file_path), sheet_name, sorted(options.items()))
+        return hashlib.blake2b(repr(parts).encode(), digest_size=20).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def load(self, key: str) -> Any | None:
+        """Returns the cached value, or None on a miss. Unreadable entries are discarded."""
+        entry = self._entry(key)
+        try:
+            with open(entry, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            entry.unlink(missing_ok=True)
+            return None
+        os.utime(entry)  # Mark as recently used
+        return value
+
+    def store(self, key: str, value: Any) -> None:
+        """
+        Writes the entry atomically and evicts old entries if the folder exceeds its budget.
+        The folder size is tracked as a running total, so the folder is only listed again when the budget is exceeded.
+        """
+        entry = self._entry(key)
+        temporary = entry.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary, 'wb') as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._entries())
+        try:
+            self._total_bytes -= entry.stat().st_size  # Replaced entry
+        except FileNotFoundError:
+            pass
+        self._total_bytes += temporary.stat().st_size
+        os.replace(temporary, entry)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _entries(self) -> list[tuple[int, int, Path]]:
+        """(mtime, size, path) of every entry in the folder."""
+        entries = []
+        for entry in self.directory.glob("*.pkl"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # Removed by another process
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        return entries
+
+    def _evict(self) -> None:
+        # Lists the folder again: other extractors or processes sharing it may have added or removed entries.
+        # Evicts down to 90% of the budget, so the next stores do not list the folder again right away
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, entry in sorted(entries):
+            if total <= target:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        for entry in self.directory.glob("*.pkl"):
+            entry.unlink(missing_ok=True)
+        self._total_bytes = 0
+
+
+class MemorySheetCache:
+    def __init__(self, max_bytes: int = 256 * 1024**2):
+        """
+        Process-local LRU cache of parsed worksheets, shared by every ExcelDataExtractor created with `memory_cache=True`.
+
+        Entries are keyed by the source file stat (path, size and mtime), the sheet and the read options, and are
+        evicted least recently used first once their estimated memory exceeds `max_bytes`. Callers always receive
+        copies, so modifying a returned DataFrame never corrupts the cached one.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Memory budget, measured with `DataFrame.memory_usage(deep=True)`. Defaults to 256 MB.
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def key(file_path: str | Path, sheet_name: str, **options) -> tuple:
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        return (path, stat.st_size, stat.st_mtime_ns, sheet_name, tuple(sorted(options.items())))
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(deep=True).sum())
+        return sys.getsizeof(value)
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        if isinstance(value, pd.DataFrame):
+            # With pandas' copy-on-write a shallow copy is already isolated from the cached frame
+            return value.copy(deep=pd.options.mode.copy_on_write is not True)
+        if isinstance(value, list):
+            return list(value)
+        return value
+
+    def get(self, key: tuple) -> Any | None:
+        """Returns a copy of the cached value, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        return self._copy(entry[0])
+
+    def put(self, key: tuple, value: Any) -> Any:
+        """Caches `value` (unless it alone exceeds the budget) and returns a copy the caller may modify."""
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+        return self._copy(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+shared_sheet_cache = MemorySheetCache()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+
+class TextMetrics:
+    def __init__(self, df: pd.DataFrame):
+        """
+        Vectorized text lengths of the cells of a DataFrame, as rendered by `str(value)`. Blank cells (NaN, None, NaT)
+        measure 0, as they are written as empty cells. Columns are measured lazily, once, and reused by every formatter
+        template and chart heuristic. Obtain instances through `text_metrics(df)`, which caches them on the DataFrame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to measure. It must not be modified in place while the metrics are in use.
+        """
+        self._frame = df
+        self.shape = df.shape
+        self._lengths: dict[int, np.ndarray] = {}
+        self._integer_lengths: dict[int, np.ndarray] = {}
+
+    def _as_str(self, col_idx: int) -> tuple[pd.Series, np.ndarray]:
+        """The column as text, and its blank cells."""
+        column = self._frame.iloc[:, col_idx]
+        if pd.api.types.is_datetime64_any_dtype(column):
+            return column.map(str), column.isna().to_numpy()  # astype(str) drops the time part that str(Timestamp) includes
+        return column.astype(str), column.isna().to_numpy()
+
+    def lengths(self, col_idx: int) -> np.ndarray:
+        """Length of `str(value)` for every cell of the column (0 for blanks)."""
+        if col_idx not in self._lengths:
+            text, blank = self._as_str(col_idx)
+            self._lengths[col_idx] = np.where(blank, 0, text.str.len().to_numpy(dtype=int))
+        return self._lengths[col_idx]
+
+    def integer_lengths(self, col_idx: int) -> np.ndarray:
+        """Length of the integer part (text before the first '.') for every cell of the column (0 for blanks)."""
+        if col_idx not in self._integer_lengths:
+            text, blank = self._as_str(col_idx)
+            dot_position = text.str.find('.').to_numpy(dtype=int)
+            lengths = np.where(dot_position >= 0, dot_position, text.str.len().to_numpy(dtype=int))
+            self._integer_lengths[col_idx] = np.where(blank, 0, lengths)
+        return self._integer_lengths[col_idx]
+
+    def max_length(self, col_idx: int) -> int:
+        lengths = self.lengths(col_idx)
+        return int(lengths.max()) if lengths.size else 0
+
+    def max_integer_length(self, col_idx: int) -> int:
+        lengths = self.integer_lengths(col_idx)
+        return int(lengths.max()) if lengths.size else 0
+
+    def percentile_length(self, col_idx: int, q: float) -> float:
+        """q-th percentile (0-100) of the text lengths, useful to size columns ignoring a few outliers."""
+        lengths = self.lengths(col_idx)
+        return float(np.percentile(lengths, q)) if lengths.size else 0.0
+
+
+def text_metrics(df: pd.DataFrame) -> TextMetrics:
+    """
+    Returns the TextMetrics of `df`, computed once per DataFrame object. The metrics are stored on the frame itself
+    (not in a global keyed by id), so they live and die with it and are never inherited by copies or derived frames.
+    """
+    metrics = df.__dict__.get("_text_metrics")
+    if metrics is None or metrics.shape != df.shape:
+        metrics = TextMetrics(df)
+        object.__setattr__(df, "_text_metrics", metrics)  # Plain attribute: pandas would treat it as a column name
+    return metrics
@@ -212,7 +212,7 @@ def reforzamiento_programas_sociales_xl():
         df_list[3] = excel.filter_data(df_list[3], dpto)
         df_list[2] = excel.concat_dataframes(df_list[2], df_list[3], "Juntos", "Pension 65")
 
-        df_list[2].iloc[:, 1:] = df_list[2].iloc[:, 1:].replace("", 0).astype(float)
+        df_list[2].iloc[:, 1:] = df_list[2].iloc[:, 1:].replace("", 0).fillna(0).astype(float)
         df_list[2].iloc[:, 1:] = df_list[2].iloc[:, 1:] / 10_000_000
         df_list[2].iloc[:, 1:] = df_list[2].iloc[:, 1:].round(2)
 
@@ -283,7 +283,6 @@ def aprovechamiento_ruta_seda():
         df_list[1] = df_list[1].iloc[:-2,:]
         df_list[1] = excel.filter_data(df_list[1], [2016], True, "column")
         df_list[2] = excel.filter_data(df_list[2], dpto, key="column")
-        df_list[3] = df_list[3].fillna(0)
         try:
             df_list[3] = excel.filter_data(df_list[3], dpto)
         except KeyError as e:
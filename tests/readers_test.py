@@ -0,0 +1,370 @@
+import glob
+import os
+import importlib.util
+import pandas as pd
+import pytest
+from excel_automation import ExcelDataExtractor
+from excel_automation.core import load_workbooks
+from excel_automation.core.excel_readers import READERS, open_reader
+
+DATABASES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "..", "databases", "*", "*.xlsx")))
+BACKENDS = [name for name in READERS if name != "calamine" or importlib.util.find_spec("python_calamine")]
+
+
+@pytest.mark.parametrize("backend", [name for name in BACKENDS if name != "openpyxl"])
+@pytest.mark.parametrize("path", DATABASES, ids=os.path.basename)
+def test_raw_parity(path: str, backend: str):
+    """Every backend parses every sheet exactly like pandas' default (openpyxl) reader."""
+    reference, candidate = open_reader(path, "openpyxl"), open_reader(path, backend)
+    assert candidate.sheet_names == reference.sheet_names
+    for sheet_name in reference.sheet_names:
+        pd.testing.assert_frame_equal(candidate.parse(sheet_name), reference.parse(sheet_name))
+    reference.close()
+    candidate.close()
+
+
+@pytest.mark.parametrize("backend", [name for name in BACKENDS if name != "openpyxl"])
+@pytest.mark.parametrize("path", DATABASES, ids=os.path.basename)
+def test_preprocessed_parity(path: str, backend: str):
+    folder, file_name = os.path.split(path)
+    with ExcelDataExtractor(file_name[:-5], folder) as reference, ExcelDataExtractor(file_name[:-5], folder, reader=backend) as candidate:
+        for expected, result in zip(reference.worksheets_to_dataframes(), candidate.worksheets_to_dataframes(), strict=True):
+            pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("backend", [name for name in BACKENDS if name != "openpyxl"])
+@pytest.mark.parametrize("path", DATABASES, ids=os.path.basename)
+def test_projection_parity(path: str, backend: str):
+    """Column/row projections pushed down into a backend match the projection of the full openpyxl parse."""
+    reference, candidate = open_reader(path, "openpyxl"), open_reader(path, backend)
+    for sheet_name in reference.sheet_names:
+        full = reference.parse(sheet_name)
+        if full.empty:
+            continue
+        columns = tuple(str(name) for name in full.columns[1::2])
+        rows = tuple(str(value) for value in full.iloc[::3, 0].tolist())
+        for selection in ({"columns": columns}, {"rows": rows}, {"columns": columns, "rows": rows}):
+            pd.testing.assert_frame_equal(candidate.parse(sheet_name, **selection), reference.parse(sheet_name, **selection))
+    reference.close()
+    candidate.close()
+
+
+def test_load_workbooks_parallel():
+    """The process-pool loader returns the same sheets as a sequential extractor and captures per-file errors."""
+    missing = os.path.join(os.path.dirname(DATABASES[0]), "missing.xlsx")
+    results = load_workbooks(DATABASES[:2] + [missing], max_workers=2)
+    assert list(results) == DATABASES[:2] + [missing]
+    assert not results[missing].ok and results[missing].error.startswith("FileNotFoundError")
+    for path in DATABASES[:2]:
+        folder, file_name = os.path.split(path)
+        with ExcelDataExtractor(file_name[:-5], folder) as reference:
+            assert list(results[path].sheets) == reference.sheet_names
+            for result, expected in zip(results[path].sheets.values(), reference.worksheets_to_dataframes(), strict=True):
+                pd.testing.assert_frame_equal(result, expected)
+
+
+def test_load_workbooks_pool_failures():
+    """Duplicated paths are loaded once, and failures of the pool itself are recorded in each file's error."""
+    results = load_workbooks([DATABASES[0], DATABASES[1], DATABASES[0]], max_workers=2, reader=lambda path: None)
+    assert list(results) == DATABASES[:2]
+    for result in results.values():
+        assert not result.ok and not result.sheets and "Pickl" in result.error
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("path", DATABASES, ids=os.path.basename)
+def test_streamed_chunks(path: str, backend: str):
+    """Concatenated chunks rebuild the cleaned sheet (for sheets whose columns all have a header and data)."""
+    folder, file_name = os.path.split(path)
+    with ExcelDataExtractor(file_name[:-5], folder, reader=backend) as extractor:
+        for sheet_index in range(len(extractor.sheet_names)):
+            expected = extractor.worksheet_to_dataframe(sheet_index).reset_index(drop=True)
+            chunks = list(extractor.iter_chunks(sheet_index, chunk_size=7))
+            if not chunks or list(chunks[0].columns) != list(expected.columns):
+                continue
+            pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+            # Later chunks keep the first chunk's dtypes, unless text shows up in a column that started numeric
+            for chunk in chunks[1:]:
+                for column, dtype in chunk.dtypes.items():
+                    assert dtype == chunks[0][column].dtype or dtype == expected[column].dtype == object, column
+            assert sum(1 for _ in extractor.iter_rows(sheet_index)) == len(expected)
+
+
+def test_streamed_aggregation():
+    """Partial aggregates merged across small chunks match a groupby on the whole cleaned sheet."""
+    compared = 0
+    for path in DATABASES:
+        folder, file_name = os.path.split(path)
+        with ExcelDataExtractor(file_name[:-5], folder, reader="iterparse") as extractor:
+            for sheet_index in range(len(extractor.sheet_names)):
+                df = extractor.worksheet_to_dataframe(sheet_index)
+                values = [col for col in df.columns[1:] if pd.api.types.is_numeric_dtype(df[col])]
+                first_chunk = next(extractor.iter_chunks(sheet_index), None)
+                if not values or first_chunk is None or first_chunk.columns.tolist() != df.columns.tolist():
+                    continue
+                key = df.columns[0]
+                keyed = df[df[key] != ""]  # Blank text keys do not form a group
+                for agg in ("sum", "mean", "count", "min", "max"):
+                    expected = keyed.groupby(key, sort=False)[values].agg(agg).reset_index()
+                    result = extractor.aggregate(key, values, agg, source=sheet_index, chunk_size=3)
+                    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+                compared += 1
+    assert compared
+
+
+def test_aggregation_drops_blank_keys():
+    """Rows whose key is "" (a cleaned blank text cell) or NaN do not form a group."""
+    df = pd.DataFrame({
+        "Departamento": ["Lima", "", "Cusco", "Lima", ""],
+        "Provincia": ["Lima", "Cusco", None, "Huaral", "Lima"],
+        "Valor": [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+    extractor = ExcelDataExtractor("unused", "")
+    result = extractor.aggregate("Departamento", "Valor", source=df)
+    pd.testing.assert_frame_equal(result, pd.DataFrame({"Departamento": ["Lima", "Cusco"], "Valor": [5.0, 3.0]}))
+    result = extractor.aggregate(["Departamento", "Provincia"], "Valor", source=df)
+    expected = pd.DataFrame({"Departamento": ["Lima", "Lima"], "Provincia": ["Lima", "Huaral"], "Valor": [1.0, 4.0]})
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_iterparse_styles_from_relationships(tmp_path):
+    """The stylesheet is found through the workbook relationships, not at a fixed part name."""
+    import zipfile
+
+    source, relocated = tmp_path / "source.xlsx", tmp_path / "relocated.xlsx"
+    expected = pd.DataFrame({"Fecha": pd.to_datetime(["2024-01-31", "2024-02-29"]), "Valor": [1, 2]})
+    expected.to_excel(source, index=False)
+    with zipfile.ZipFile(source) as archive, zipfile.ZipFile(relocated, "w") as output:
+        for item in archive.infolist():
+            data = archive.read(item.filename)
+            if item.filename in ("[Content_Types].xml", "xl/_rels/workbook.xml.rels"):
+                data = data.replace(b"styles.xml", b"estilos/hoja_de_estilos.xml")
+            output.writestr("xl/estilos/hoja_de_estilos.xml" if item.filename == "xl/styles.xml" else item.filename, data)
+
+    reader = open_reader(str(relocated), "iterparse")
+    pd.testing.assert_frame_equal(reader.parse(reader.sheet_names[0]), expected)
+    reader.close()
+
+
+@pytest.mark.parametrize("with_dates", [False, True], ids=["streamed", "to_excel"])
+def test_export_keeps_urls_and_formula_text(tmp_path, with_dates: bool):
+    """URL-like and "="-prefixed text is written as text, and a rejected cell does not drop the rest of its row."""
+    df = pd.DataFrame({
+        "Fuente": ["https://www.inei.gob.pe", "=1+1", "https://example.com/" + "a" * 2100, "x" * 40000],
+        "Valor": [1, 2, 3, 4],
+    })
+    if with_dates:
+        df["Fecha"] = pd.to_datetime("2024-01-31")  # Needs a number format, so the frame goes through to_excel
+    (tmp_path / "otros").mkdir()
+    ExcelDataExtractor("unused", str(tmp_path)).dataframe_to_worksheet(df, "out", str(tmp_path))
+
+    result = pd.read_excel(tmp_path / "otros" / "out.xlsx")
+    expected = df.assign(Fuente=df["Fuente"].str.slice(0, 32767))  # Excel's cell text limit
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_transpose_is_not_fragmented():
+    """Mixed rows become typed columns in a consolidated frame (no PerformanceWarning from repeated inserts)."""
+    import warnings
+
+    n_rows = 300
+    df = pd.DataFrame({
+        "Indicador": [f"I{i}" for i in range(n_rows)],
+        "Lima": [i if i % 2 else f"t{i}" for i in range(n_rows)],
+        "Cusco": [i * 2 if i % 2 else "-" for i in range(n_rows)],
+    })
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", pd.errors.PerformanceWarning)
+        result = ExcelDataExtractor._transpose(df)
+
+    assert result.columns.tolist() == ["Indicador"] + df["Indicador"].tolist()
+    assert result["Indicador"].tolist() == ["Lima", "Cusco"]
+    assert result["I1"].dtype == "int64" and result["I1"].tolist() == [1, 2]
+    assert result["I0"].dtype == object and result["I0"].tolist() == ["t0", "-"]
+
+
+@pytest.mark.parametrize("rows", [("Lima",), ("x",), ("",), ("Cusco", "x")])
+def test_row_selection_while_streaming(tmp_path, rows: tuple):
+    """Rows dropped while streaming still count for the key column and the sheet width, as in the full parse."""
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    for row in (
+        [None, "Nombre", 2020, 2021],
+        [None, "Lima", 1, 2],
+        [None, "Cusco", 4, 5, 6, 7],  # Widest row
+        ["x", "Puno", 7, 8],  # Moves the key column to A
+    ):
+        worksheet.append(row)
+    path = str(tmp_path / "rows.xlsx")
+    workbook.save(path)
+
+    reference, candidate = open_reader(path, "openpyxl"), open_reader(path, "iterparse")
+    for selection in ({"rows": rows}, {"rows": rows, "columns": ("2021",)}):
+        pd.testing.assert_frame_equal(candidate.parse("Sheet", **selection), reference.parse("Sheet", **selection))
+    reference.close()
+    candidate.close()
+
+
+def test_partition_validates_kept_rows():
+    """Blank first-column values do not form a partition, and an unknown kept row raises as an unknown category does."""
+    from excel_automation.utils import RowIndex
+
+    df = pd.DataFrame({"Departamento": ["Lima", "", "Cusco", None, "Perú"], "2020": [1, 2, 3, 4, 5]})
+    assert RowIndex(df).categories == ["Lima", "Cusco", "Perú"]
+
+    extractor = ExcelDataExtractor("unused", "")
+    assert list(extractor.partition_data(df, keep="Perú")) == ["Lima", "Cusco"]
+    for categories in (None, ["Lima"]):
+        with pytest.raises(KeyError, match="Peru"):
+            extractor.partition_data(df, categories, keep="Peru")
+
+
+def sample_workbook(folder, values: tuple = (1, 2)) -> str:
+    """Writes a three-sheet workbook in `folder` and returns its name (without extension)."""
+    with pd.ExcelWriter(os.path.join(folder, "muestra.xlsx")) as writer:
+        for sheet in ("Indice", "Hoja1", "Hoja2"):
+            pd.DataFrame({"Departamento": ["Lima", "Cusco"], "2020": list(values)}).to_excel(writer, sheet_name=sheet, index=False)
+    return "muestra"
+
+
+def test_workbook_opened_once(tmp_path, monkeypatch):
+    """Sheet names, single-sheet and all-sheet reads share one workbook handle until `close()`."""
+    from excel_automation.core import excel_data_extractor
+
+    opened = []
+    def counting_open_reader(*args, **kwargs):
+        opened.append(args)
+        return open_reader(*args, **kwargs)
+    monkeypatch.setattr(excel_data_extractor, "open_reader", counting_open_reader)
+
+    with ExcelDataExtractor(sample_workbook(tmp_path), str(tmp_path)) as extractor:
+        assert extractor.sheet_names == ["Indice", "Hoja1", "Hoja2"]
+        extractor.worksheet_to_dataframe(1)
+        assert len(extractor.worksheets_to_dataframes(lazy=False)) == 3
+        assert len(opened) == 1
+        extractor.close()
+        assert extractor.worksheet_to_dataframe(2)["2020"].tolist() == [1, 2]  # Reopened on demand
+        assert len(opened) == 2
+    assert extractor._workbook is None
+
+
+def test_disk_cache_hit_and_invalidation(tmp_path, monkeypatch):
+    """A second extractor reads cached sheets without opening the workbook; editing the workbook invalidates them."""
+    from excel_automation.core import excel_data_extractor
+
+    cache_dir = str(tmp_path / "cache")
+    file_name = sample_workbook(tmp_path)
+    with ExcelDataExtractor(file_name, str(tmp_path), cache_dir=cache_dir) as extractor:
+        expected = extractor.worksheets_to_dataframes(lazy=False)
+    assert os.listdir(cache_dir)
+
+    def fail_to_open(*args, **kwargs):
+        raise AssertionError("the workbook should not be opened")
+    with monkeypatch.context() as patch:
+        patch.setattr(excel_data_extractor, "open_reader", fail_to_open)
+        with ExcelDataExtractor(file_name, str(tmp_path), cache_dir=cache_dir) as extractor:
+            for result, reference in zip(extractor.worksheets_to_dataframes(lazy=False), expected, strict=True):
+                pd.testing.assert_frame_equal(result, reference)
+
+    sample_workbook(tmp_path, values=(3, 4))
+    with ExcelDataExtractor(file_name, str(tmp_path), cache_dir=cache_dir) as extractor:
+        assert extractor.worksheet_to_dataframe(1)["2020"].tolist() == [3, 4]
+
+
+def test_memory_cache_shared_and_isolated(tmp_path, monkeypatch):
+    """Extractors share parsed sheets in memory, and a caller modifying its frame does not corrupt the cached one."""
+    from excel_automation.core import excel_data_extractor
+    from excel_automation.utils.sheet_cache import shared_sheet_cache
+
+    shared_sheet_cache.clear()
+    file_name = sample_workbook(tmp_path)
+    with ExcelDataExtractor(file_name, str(tmp_path), memory_cache=True) as extractor:
+        first = extractor.worksheet_to_dataframe(1)
+    first.loc[0, "2020"] = 100
+
+    def fail_to_open(*args, **kwargs):
+        raise AssertionError("the workbook should not be opened")
+    monkeypatch.setattr(excel_data_extractor, "open_reader", fail_to_open)
+    second = ExcelDataExtractor(file_name, str(tmp_path), memory_cache=True).worksheet_to_dataframe(1)
+    assert second["2020"].tolist() == [1, 2]
+    shared_sheet_cache.clear()
+
+
+def test_lazy_sheets_parse_on_access(tmp_path):
+    """Only indexed or sliced sheets are parsed, once, and the lazy sequence matches the eager list."""
+    import pickle
+    from excel_automation.utils import LazySheets
+
+    with ExcelDataExtractor(sample_workbook(tmp_path), str(tmp_path)) as extractor:
+        expected = extractor.worksheets_to_dataframes(lazy=False)
+        sheets = extractor.worksheets_to_dataframes()
+        assert isinstance(sheets, LazySheets) and sheets.loaded == [False, False, False]
+        assert len(sheets[1:]) == 2 and sheets.loaded == [False, True, True]
+        assert sheets[1] is sheets[1]  # Memoized
+        assert len(extractor.worksheets_to_dataframes(include_first=False)) == 2
+        restored = pickle.loads(pickle.dumps(sheets))
+    assert type(restored) is list
+    for result, reference in zip(restored, expected, strict=True):
+        pd.testing.assert_frame_equal(result, reference)
+
+
+@pytest.mark.parametrize("selection", [["Lima"], ["Perú", "Lima"], ["Cusco", "Puno", "Perú"]])
+def test_row_index_matches_boolean_mask(selection: list):
+    """Row selections served by the RowIndex equal the former isin mask + set_index(...).loc selection."""
+    df = pd.DataFrame({
+        "Departamento": ["Lima", "Cusco", "Lima", "Perú", "Puno", "Cusco"],
+        "2020": [1.0, 2.0, 3.0, 4.0, None, 6.0],
+        "Fuente": ["a", "b", "c", "d", "e", "f"],
+    }, index=range(10, 16))
+    extractor = ExcelDataExtractor("unused", "")
+    mask = df.iloc[:, 0].isin(selection)
+    expected = df[mask].set_index(df.columns[0]).loc[selection].reset_index()
+    for source in (df, extractor.index_rows(df)):
+        pd.testing.assert_frame_equal(extractor.filter_data(source, selection, key="row"), expected)
+        pd.testing.assert_frame_equal(extractor.filter_data(source, selection, filter_out=True, key="row"), df[~mask])
+    with pytest.raises(KeyError, match="Arequipa"):
+        extractor.filter_data(extractor.index_rows(df), selection + ["Arequipa"], key="row")
+
+
+def test_concat_multiple_dataframes_aligns_on_first_frame():
+    """Frames are aligned on the first frame's rows, columns take their frame's name and the inputs are not modified."""
+    dfs = [
+        pd.DataFrame({"Departamento": ["Lima", "Cusco", "Puno"], "Valor": [1, 2, 3]}),
+        pd.DataFrame({"Departamento": ["Puno", "Lima", "Tacna"], "Valor": [30.0, 10.0, 40.0]}),
+        pd.DataFrame({"Departamento": ["Cusco", "Lima", "Puno"], "Valor": [200, 100, 300]}),
+    ]
+    originals = [df.copy() for df in dfs]
+    result = ExcelDataExtractor("unused", "").concat_multiple_dataframes(dfs, ["2019", "2020", "2021"])
+
+    expected = pd.DataFrame({
+        "Departamento": ["Lima", "Cusco", "Puno"],
+        "2019": [1, 2, 3],
+        "2020": [10.0, None, 30.0],
+        "2021": [100, 200, 300],
+    })
+    pd.testing.assert_frame_equal(result, expected)
+    for df, original in zip(dfs, originals):
+        pd.testing.assert_frame_equal(df, original)
+
+
+@pytest.mark.parametrize("key", ["row", "column"])
+def test_partition_matches_filter_data(key: str):
+    """Each partition equals the `filter_data` call it replaces, for one frame and for a list of frames."""
+    df = pd.DataFrame({
+        "Departamento": ["Lima", "Cusco", "Perú", "Lima", "Puno"],
+        "Lima": [1, 2, 3, 4, 5],
+        "Cusco": [6, 7, 8, 9, 10],
+        "Perú": [11, 12, 13, 14, 15],
+    })
+    extractor = ExcelDataExtractor("unused", "")
+    partitions = extractor.partition_data(df, keep="Perú", key=key)
+    expected_categories = ["Lima", "Cusco", "Puno"] if key == "row" else ["Lima", "Cusco"]
+    assert list(partitions) == expected_categories
+    for category, partition in partitions.items():
+        pd.testing.assert_frame_equal(partition, extractor.filter_data(df, [category, "Perú"], key=key))
+
+    per_frame = extractor.partition_data([df, extractor.index_rows(df)], ["Cusco"], keep="Perú", key=key)
+    for partitions in per_frame:
+        pd.testing.assert_frame_equal(partitions["Cusco"], extractor.filter_data(df, ["Cusco", "Perú"], key=key))
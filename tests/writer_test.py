@@ -0,0 +1,230 @@
+import openpyxl
+import pandas as pd
+import pytest
+from excel_automation.core.excel_writer import ExcelWriterXL
+
+LONG_URL = "https://example.com/" + "a" * 2100
+LONG_TEXT = "x" * 40000  # Over Excel's 32767 characters: xlsxwriter truncates it and returns an error code
+
+
+def read_back(path) -> dict[str, list[list]]:
+    workbook = openpyxl.load_workbook(path)
+    return {worksheet.title: [list(row) for row in worksheet.iter_rows(values_only=True)] for worksheet in workbook}
+
+
+@pytest.mark.parametrize("constant_memory", [False, True])
+@pytest.mark.parametrize("template", ["database", "report", "text_table"])
+def test_rejected_cell_keeps_its_neighbours(tmp_path, template: str, constant_memory: bool):
+    """A cell that xlsxwriter rejects or truncates must not drop the cells written after it in the same batch."""
+    df = pd.DataFrame({"Fuente": ["INEI", LONG_URL, LONG_TEXT, "MINEDU", "ENAHO"], "Nota": ["a", LONG_TEXT, "b", "c", "d"]})
+    writer = ExcelWriterXL([df], "out", tmp_path, constant_memory=constant_memory)
+    writer.write_from_df(df, "Hoja1", "0", template)
+    writer.save_workbook()
+
+    rows = read_back(tmp_path / "out.xlsx")["Hoja1"]
+    assert [row[0] for row in rows[1:]] == ["INEI", LONG_URL, LONG_TEXT[:32767], "MINEDU", "ENAHO"]
+    assert [row[1] for row in rows[1:]] == ["a", LONG_TEXT[:32767], "b", "c", "d"]
+
+
+def test_urls_stay_hyperlinks(tmp_path):
+    """URL-like text is still written as a hyperlink (xlsxwriter's default); only over-long ones fall back to text."""
+    df = pd.DataFrame({"Fuente": ["https://www.inei.gob.pe", LONG_URL], "Nota": ["a", "b"]})
+    writer = ExcelWriterXL([df], "out", tmp_path)
+    writer.write_from_df(df, "Hoja1", "0", "database")
+    writer.save_workbook()
+
+    worksheet = openpyxl.load_workbook(tmp_path / "out.xlsx")["Hoja1"]
+    assert worksheet["A2"].hyperlink.target == "https://www.inei.gob.pe"
+    assert worksheet["A3"].hyperlink is None and worksheet["A3"].value == LONG_URL
+
+
+def test_bar_chart_points(tmp_path):
+    """Bar points carry a fill only when highlighted, and the label mask uses the baseline `value > 9999` threshold."""
+    from excel_automation import ExcelAutoChart
+
+    df = pd.DataFrame({"Departamento": ["Lima", "Cusco", "Puno"], "Valor": [9999.5, 5.0, 20000.0]})
+    chart_creator = ExcelAutoChart([df, df], "bar", tmp_path)
+    chart_creator.create_bar_chart(0, "Fig1", numeric_type="integer")
+    chart_creator.create_bar_chart(1, "Fig2", numeric_type="integer", highlighted_category="Cusco")
+    plain, highlighted = (chart.series[0] for chart in chart_creator.writer.workbook.charts)
+    chart_creator.save_workbook()
+
+    assert [bool(point) for point in plain['points']] == [True, False, True]  # 9999.5 and 20000 get the '# ##0' labels
+    assert all(not point or not point['fill']['defined'] for point in plain['points'])
+    assert [bool(point) and point['fill']['defined'] for point in highlighted['points']] == [False, True, False]
+
+
+def test_bar_chart_highlights_a_list_of_categories(tmp_path):
+    """A list of categories highlights every one of them (scripts pass e.g. `highlighted_category=[dpto]`)."""
+    from excel_automation import ExcelAutoChart
+
+    df = pd.DataFrame({"Departamento": ["Lima", "Cusco", "Puno"], "Valor": [1.0, 5.0, 2.0]})
+    chart_creator = ExcelAutoChart([df], "bar", tmp_path)
+    chart_creator.create_bar_chart(0, "Fig1", highlighted_category=["Cusco", "Puno"])
+    series = chart_creator.writer.workbook.charts[0].series[0]
+    chart_creator.save_workbook()
+    assert [bool(point) and point['fill']['defined'] for point in series['points']] == [False, True, True]
+
+
+def test_plain_header_matches_to_excel(tmp_path):
+    """format_template=None gives the same bold, bordered header in default and constant_memory mode."""
+    df = pd.DataFrame({"Año": ["2023", "2024"], "Valor": [1.5, 2.5]})
+    headers = []
+    for constant_memory in (False, True):
+        writer = ExcelWriterXL([df], f"plain_{constant_memory}", tmp_path, constant_memory=constant_memory)
+        writer.write_from_df(df, "Hoja1", "0", None)
+        writer.save_workbook()
+        worksheet = openpyxl.load_workbook(tmp_path / f"plain_{constant_memory}.xlsx")["Hoja1"]
+        headers.append([(cell.value, cell.font.b, cell.border.top.style, cell.alignment.horizontal) for cell in worksheet[1]])
+    assert headers[0] == headers[1] == [("Año", True, "thin", "center"), ("Valor", True, "thin", "center")]
+
+
+@pytest.mark.parametrize("n_rows, height", [(3, 26), (12, 18)])
+def test_data_table_row_heights_stop_at_the_table(tmp_path, n_rows: int, height: float):
+    """Rows below a data_table (a source note, a second table, a chart) keep the default height."""
+    df = pd.DataFrame({"Departamento": [f"Dep {i}" for i in range(n_rows)], "2024": [float(i) for i in range(n_rows)]})
+    writer = ExcelWriterXL([df, df], "out", tmp_path)
+    writer.write_from_df(df, "Hoja1", "0", "data_table")
+    note_row = n_rows + 2
+    writer.write_to_excel("Hoja1", note_row, 0, "Fuente: INEI")
+    _, worksheet = writer.write_from_df(df, "Hoja2", "0", "data_table")
+    worksheet.insert_chart(f"A{n_rows + 4}", writer.workbook.add_chart({"type": "bar"}))
+    writer.workbook.charts[-1].add_series({"values": ["Hoja2", 1, 1, n_rows, 1]})
+    writer.save_workbook()
+
+    workbook = openpyxl.load_workbook(tmp_path / "out.xlsx")
+    for worksheet in workbook:
+        assert worksheet.sheet_format.defaultRowHeight == 15
+        assert [worksheet.row_dimensions[row].height for row in range(2, n_rows + 2)] == [height] * n_rows
+        assert worksheet.row_dimensions[note_row + 1].height is None
+
+
+def test_format_plan_cache_is_bounded(tmp_path, monkeypatch):
+    """Plans for many distinct schemas evict the least recently used ones instead of growing without limit."""
+    from excel_automation.core import excel_formatter
+
+    monkeypatch.setattr(excel_formatter, "MAX_FORMAT_PLANS", 3)
+    monkeypatch.setattr(excel_formatter, "_FORMAT_PLANS", excel_formatter.OrderedDict())
+    writer = ExcelWriterXL([], "out", tmp_path)
+    frames = [pd.DataFrame({f"Columna {i}": ["a"], "Valor": [1.0]}) for i in range(5)]
+    first_plan = writer.formatter.compile_plan("database", frames[0], "0")
+    for df in frames[1:]:
+        assert writer.formatter.compile_plan("database", frames[0], "0") is first_plan  # Kept as most recently used
+        writer.formatter.compile_plan("database", df, "0")
+    writer.save_workbook()
+    assert len(excel_formatter._FORMAT_PLANS) == 3
+    assert first_plan in excel_formatter._FORMAT_PLANS.values()
+
+
+@pytest.mark.parametrize("template", ["database", "data_table"])
+def test_numeric_columns_stay_numeric(tmp_path, template: str):
+    """Blanks are written as empty cells without turning the numeric columns of the frame into object columns."""
+    df = pd.DataFrame({"Departamento": ["Lima", None, "Puno"], "2024": [1.5, float("nan"), 20000.0]})
+    writer = ExcelWriterXL([df], "out", tmp_path)
+    written, _ = writer.write_from_df(df, "Hoja1", "0", template)
+    writer.save_workbook()
+
+    assert written["2024"].dtype == "float64"
+    assert read_back(tmp_path / "out.xlsx")["Hoja1"][1:] == [["Lima", 1.5], [None, None], ["Puno", 20000]]
+    # Blank body cells keep the data format (number format and borders) of their column
+    worksheet = openpyxl.load_workbook(tmp_path / "out.xlsx")["Hoja1"]
+    blank, filled = worksheet["B3"], worksheet["B2"]
+    assert (blank.number_format, blank.border.bottom.style) == (filled.number_format, filled.border.bottom.style) == ("0", "thin")
+
+
+TEMPLATES = ["database", "index", "data_table", "text_table", "report", None]
+
+
+def template_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Departamento": [f"Dep {i}" for i in range(15)],
+        "2023": [float(i * 1500) for i in range(15)],
+        "2024": [None if i % 4 == 0 else i + 0.25 for i in range(15)],
+    })
+
+
+def cell_signatures(path) -> list[list[tuple]]:
+    """Value and main style attributes of every cell of the first sheet."""
+    worksheet = openpyxl.load_workbook(path).worksheets[0]
+    return [
+        [(cell.value, cell.number_format, cell.font.b, cell.fill.fgColor.rgb, cell.border.bottom.style) for cell in row]
+        for row in worksheet.iter_rows()
+    ]
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_template_read_back(tmp_path, template: str | None):
+    """Every template writes the same cells in default and constant_memory mode, from a whole frame or from chunks."""
+    df = template_frame()
+    expected_values = [df.columns.tolist()] + [[None if pd.isna(value) else value for value in row] for row in df.itertuples(index=False)]
+    signatures = {}
+    for constant_memory in (False, True):
+        for chunked in (False, True):
+            name = f"out_{constant_memory}_{chunked}"
+            writer = ExcelWriterXL([df], name, tmp_path, constant_memory=constant_memory)
+            source = (df.iloc[start:start + 4] for start in range(0, len(df), 4)) if chunked else df
+            writer.write_from_df(source, "Hoja1", "0.0", template)
+            writer.save_workbook()
+            signatures[name] = cell_signatures(tmp_path / f"{name}.xlsx")
+            assert [[value for value, *_ in row] for row in signatures[name]] == expected_values, name
+
+    reference = signatures.pop("out_False_False")
+    assert all(bold for _, _, bold, *_ in reference[0])  # Styled header in every template
+    for name, signature in signatures.items():
+        assert signature == reference, name
+
+
+def test_text_metrics_cached_on_the_frame():
+    """Metrics are computed once per DataFrame, not shared with copies, and blanks measure 0 (not len('nan'))."""
+    from excel_automation.utils import text_metrics
+
+    df = pd.DataFrame({"Departamento": ["Lima", None, "Cusco"], "2024": [1234.5, float("nan"), 7.0]})
+    metrics = text_metrics(df)
+    assert text_metrics(df) is metrics
+    assert text_metrics(df.copy()) is not metrics
+    assert metrics.lengths(0).tolist() == [4, 0, 5]
+    assert metrics.integer_lengths(1).tolist() == [4, 0, 1]
+
+
+def test_frozen_templates_keep_lists(tmp_path):
+    """Lists in the shared templates stay lists, so xlsxwriter options checked with isinstance(list) still apply."""
+    import copy
+    import pickle
+    from excel_automation.utils import Formats
+
+    legend = Formats().charts["cleveland_dot"]["legend"]
+    assert isinstance(legend["delete_series"], list)
+    with pytest.raises(TypeError):
+        legend["delete_series"].append(-2)
+    assert type(copy.deepcopy(legend)["delete_series"]) is list
+    assert pickle.loads(pickle.dumps(legend)) == legend
+
+    writer = ExcelWriterXL([], "out", tmp_path)
+    chart = writer.workbook.add_chart({"type": "line"})
+    chart.set_legend(legend)
+    assert chart.legend["delete_series"] == [-1]
+    writer.save_workbook()
+
+
+@pytest.mark.parametrize("template", ["data_table", "text_table"])
+def test_conditional_formatting_mode(tmp_path, template: str):
+    """Banding and highlighting move to conditional formats: same values, one cell style per body column."""
+    df = pd.DataFrame({
+        "Departamento": [f"D{i}" for i in range(30)] + ["Perú"],
+        "2020": [i * 1000.5 for i in range(31)],
+        "2021": list(range(31)),
+    })
+    sheets = {}
+    for conditional_formatting in (False, True):
+        writer = ExcelWriterXL([df], f"out_{conditional_formatting}", tmp_path, conditional_formatting=conditional_formatting)
+        writer.write_from_df(df, "Hoja1", "0", template, highlighted_categories="Perú")
+        writer.save_workbook()
+        sheets[conditional_formatting] = openpyxl.load_workbook(tmp_path / f"out_{conditional_formatting}.xlsx")["Hoja1"]
+
+    per_cell, conditional = sheets[False], sheets[True]
+    assert list(conditional.values) == list(per_cell.values)
+    assert not per_cell.conditional_formatting
+    body = [column[-len(df):] for column in conditional.iter_cols()]
+    assert [len({cell.style_id for cell in column}) for column in body] == [1, 1, 1]
+    formulas = [formula for ranges in conditional.conditional_formatting for rule in ranges.rules for formula in rule.formula]
+    assert ('OR($A2="Perú")' if template == "data_table" else "MOD(ROW(),2)=0") in formulas